@@ -0,0 +1,167 @@
+"""Benchmark G2P syllable rewriting against the original str.replace cascade,
+word preprocessing (lowercasing, cleaning, syllabification) against the
+original per-character loops on a long document, G2P.convert with and without
+the word cache, and convert_many throughput per worker count.
+
+Run with: uv run python benchmarks/bench_g2p.py
+"""
+
+import itertools
+import os
+import random
+import timeit
+
+from mon_nlp import g2p
+from mon_nlp.g2p import (
+    ALPHABETS_LOWER,
+    ALPHABETS_UPPER,
+    CONSONANTS,
+    CONSONANTS_REGULAR,
+    CONSONANTS_SOFT_I,
+    CONSONANTS_SOFT_SIGN,
+    DOUBLE_VOWELS,
+    G_SPECIAL,
+    IA_VOWELS,
+    SIGNS,
+    SINGLE_VOWELS,
+    VOWELS_NORMAL,
+    VOWELS_YA,
+    YA_VOWELS,
+)
+
+TEXT = "магадгүй тэртээ олон зуун жилийн өмнө монгол хэлний биологи сайн байна уу " * 20
+
+
+def syllable_to_phoneme_legacy(syl: str, is_masculine: bool, stressed: bool) -> str:
+    for i in range(len(syl)):
+        if syl[i] == "н":
+            if i + 1 == len(syl):
+                syl = syl[:i] + "ng-"
+                break
+            if i + 1 < len(syl) and syl[i + 1] in CONSONANTS:
+                syl = syl[:i] + "ng-" + syl[i + 1 :]
+                break
+    if is_masculine:
+        for cy, ph in CONSONANTS_SOFT_I:
+            syl = syl.replace(cy, ph)
+    for cy, ph in CONSONANTS_SOFT_SIGN:
+        syl = syl.replace(cy, ph)
+    for cy, ph in G_SPECIAL:
+        syl = syl.replace(cy, ph)
+    syl_list = list(syl)
+    for i in range(1, len(syl_list)):
+        if syl_list[i] == "е" and syl[i - 1] in CONSONANTS:
+            syl_list[i] = "э"
+    syl = "".join(syl_list)
+    for cy, ph in YA_VOWELS:
+        syl = syl.replace(cy, ph)
+    stress = "1-" if stressed else "0-"
+    for cy, ph in IA_VOWELS + DOUBLE_VOWELS + SINGLE_VOWELS:
+        syl = syl.replace(cy, ph + stress)
+    for cy, ph in CONSONANTS_REGULAR:
+        syl = syl.replace(cy, ph)
+    if syl.endswith("-"):
+        syl = syl[:-1]
+    return syl
+
+
+def preprocess_legacy(text: str) -> list[list[str]]:
+    result = []
+    for word in text.split():
+        cleaned = "".join(c for c in word.lower() if c in ALPHABETS_LOWER)
+        if not cleaned:
+            continue
+        word = "".join(
+            ALPHABETS_LOWER[ALPHABETS_UPPER.find(c)] if ALPHABETS_UPPER.find(c) >= 0 else c
+            for c in cleaned
+        )
+        syllables = []
+        start = 0
+        for i in range(1, len(word)):
+            if word[i] in VOWELS_NORMAL:
+                if word[i - 1] not in CONSONANTS:
+                    continue
+                if start == 0 and i == 1:
+                    continue
+                syllables.append(word[start : i - 1])
+                start = i - 1
+            elif word[i] in VOWELS_YA:
+                if word[i - 1] in SIGNS or word[i - 1] in VOWELS_NORMAL:
+                    syllables.append(word[start:i])
+                    start = i
+                    continue
+                if word[i - 1] in CONSONANTS:
+                    if start == 0 and i == 1:
+                        continue
+                    syllables.append(word[start : i - 1])
+                    start = i - 1
+        syllables.append(word[start:])
+        result.append(syllables)
+    return result
+
+
+def preprocess(converter: g2p.G2P, text: str) -> list[list[str]]:
+    return [converter._syllabify_word(word) for word in text.translate(g2p._CLEAN_TABLE).split()]
+
+
+def check_equivalence() -> int:
+    converter = g2p.G2P()
+    letters = g2p.ALPHABETS_LOWER
+    syllables = ["".join(p) for n in range(1, 4) for p in itertools.product(letters, repeat=n)]
+    rng = random.Random(0)
+    syllables += ["".join(rng.choices(letters, k=rng.randint(4, 8))) for _ in range(200_000)]
+    for syl in syllables:
+        for is_masculine, stressed in itertools.product((False, True), repeat=2):
+            expected = syllable_to_phoneme_legacy(syl, is_masculine, stressed)
+            actual = converter._syllable_to_phoneme(syl, is_masculine, stressed)
+            assert actual == expected, (syl, is_masculine, stressed, actual, expected)
+    return len(syllables)
+
+
+def main():
+    print(f"{check_equivalence()} syllables match the legacy cascade")
+    converter = g2p.G2P()
+    syllables = [
+        (syl, i == 0) for word in TEXT.split() for i, syl in enumerate(g2p.syllabify(word))
+    ]
+    legacy = timeit.timeit(
+        lambda: [syllable_to_phoneme_legacy(syl, True, s) for syl, s in syllables], number=20
+    )
+    scan = timeit.timeit(
+        lambda: [converter._syllable_to_phoneme(syl, True, s) for syl, s in syllables], number=20
+    )
+    per_call = 20 * len(syllables)
+    print(
+        f"syllable: legacy {legacy / per_call * 1e6:.2f} us  "
+        f"scan {scan / per_call * 1e6:.2f} us  x{legacy / scan:.1f}"
+    )
+    document = " ".join(random.Random(0).choices(TEXT.split() + ["Монгол,", "(ТВ)"], k=200_000))
+    assert preprocess_legacy(document) == preprocess(converter, document)
+    legacy = timeit.timeit(lambda: preprocess_legacy(document), number=1)
+    tables = timeit.timeit(lambda: preprocess(converter, document), number=1)
+    print(
+        f"preprocess 200k-word document: legacy {legacy:.3f} s  "
+        f"tables {tables:.3f} s  x{legacy / tables:.1f}"
+    )
+
+    convert = timeit.timeit(lambda: converter.convert(TEXT), number=20)
+    cached_converter = g2p.G2P(cache_size=g2p.DEFAULT_CACHE_SIZE)
+    cached = timeit.timeit(lambda: cached_converter.convert(TEXT), number=20)
+    print(
+        f"convert {len(TEXT.split())} words: {convert / 20 * 1e3:.2f} ms  "
+        f"cached {cached / 20 * 1e3:.2f} ms  x{convert / cached:.1f}"
+    )
+
+    rng = random.Random(0)
+    words = TEXT.split()
+    corpus = [" ".join(rng.choices(words, k=12)) for _ in range(200_000)]
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = timeit.default_timer()
+        for _ in g2p.G2P().convert_many(corpus, workers=workers, chunksize=2000):
+            pass
+        elapsed = timeit.default_timer() - start
+        print(f"convert_many workers={workers}: {len(corpus) / elapsed:,.0f} sentences/s")
+
+
+if __name__ == "__main__":
+    main()
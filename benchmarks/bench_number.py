@@ -0,0 +1,101 @@
+"""Benchmark integer verbalization.
+
+Compares num2words against the original per-chunk word builder, times
+words2num over a million round trips, and compares num2words_batch against a
+plain loop over a column of repeated prices.
+
+Run with: uv run python benchmarks/bench_number.py
+"""
+
+import random
+import timeit
+
+from mon_nlp import number
+from mon_nlp.number import NUMBER_NAMES
+
+
+def num2words_3digits_legacy(n: int, cont: bool = False, include_leading_one: bool = True) -> str:
+    if n == 0:
+        return NUMBER_NAMES[0][0]
+    unit, ten, hundred = n % 10, (n // 10) % 10, (n // 100) % 10
+    parts = []
+    if unit:
+        parts.append(NUMBER_NAMES[unit][1 if cont else 0])
+    if ten:
+        parts.append(NUMBER_NAMES[ten * 10][1 if parts else (1 if cont else 0)])
+    if hundred:
+        parts.append(NUMBER_NAMES[100][1 if parts else (1 if cont else 0)])
+        if hundred == 1 and include_leading_one:
+            parts.append(NUMBER_NAMES[hundred][0])
+        elif hundred > 1:
+            parts.append(NUMBER_NAMES[hundred][1])
+    return " ".join(reversed(parts))
+
+
+def num2words_legacy(n: int, include_leading_one: bool = True) -> str:
+    if n == 0:
+        return NUMBER_NAMES[0][0]
+    parts = []
+    remaining = n
+    current_unit = 1
+    while remaining > 0:
+        chunk = remaining % 1000
+        remaining = remaining // 1000
+        if chunk > 0:
+            if current_unit != 1:
+                parts.append(NUMBER_NAMES[current_unit][0])
+            if chunk > 1 or include_leading_one:
+                parts.append(
+                    num2words_3digits_legacy(
+                        chunk,
+                        cont=(len(parts) > 0 and chunk > 1),
+                        include_leading_one=include_leading_one,
+                    )
+                )
+        current_unit *= 1000
+    return " ".join(reversed(parts))
+
+
+MAGNITUDES = {
+    "count (< 100)": (0, 99),
+    "price (< 10^6)": (100, 999_999),
+    "amount (< 10^9)": (1_000_000, 999_999_999),
+    "large (< 10^15)": (10**9, 999 * 10**12),
+}
+
+
+def main():
+    rng = random.Random(0)
+    number.num2words(1)  # Build the chunk tables outside the timed loop
+    for label, (low, high) in MAGNITUDES.items():
+        values = [rng.randint(low, high) for _ in range(10_000)]
+        assert [num2words_legacy(v) for v in values] == [number.num2words(v) for v in values]
+        legacy = timeit.timeit(lambda: [num2words_legacy(v) for v in values], number=5)
+        table = timeit.timeit(lambda: [number.num2words(v) for v in values], number=5)
+        per_call = 5 * len(values)
+        print(
+            f"{label:>16}: legacy {legacy / per_call * 1e6:6.2f} us  "
+            f"table {table / per_call * 1e6:6.2f} us  x{legacy / table:.1f}"
+        )
+
+    values = [rng.randint(-999 * 10**12, 999 * 10**12) for _ in range(1_000_000)]
+    texts = [number.num2words(v) for v in values]
+    start = timeit.default_timer()
+    assert [number.words2num(t) for t in texts] == values
+    print(f"{len(values)} words2num round trips: {timeit.default_timer() - start:.2f} s")
+
+    prices = [rng.randint(0, 99_999) for _ in range(200_000)]
+    loop = timeit.timeit(lambda: [number.num2words(v) for v in prices], number=1)
+    batch = timeit.timeit(lambda: number.num2words_batch(prices), number=1)
+    print(f"{len(prices)} prices: loop {loop:.3f} s  batch {batch:.3f} s  x{loop / batch:.1f}")
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    array = np.array(prices, dtype=np.int64)
+    vectorized = timeit.timeit(lambda: number.num2words_batch(array), number=1)
+    print(f"{len(prices)} prices: numpy batch {vectorized:.3f} s  x{loop / vectorized:.1f}")
+
+
+if __name__ == "__main__":
+    main()
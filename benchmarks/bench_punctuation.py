@@ -0,0 +1,76 @@
+"""Benchmark punctuation normalization, to-words conversion and removal.
+
+Compares each function against the original per-call loops (and a
+``str.maketrans`` table for ``normalize``).
+
+Run with: uv run python benchmarks/bench_punctuation.py
+"""
+
+import re
+import timeit
+
+from mon_nlp import punctuation
+
+TEXTS = {
+    "marked sentence": "“Сайн, байна уу?” гэж тэр «хэлэв» – ‘тийм’… 5% (тест) ",
+    "plain sentence": "Сайн байна уу гэж тэр хэлэв тийм ээ гэж хариулав ",
+}
+
+
+def normalize_loop(text: str) -> str:
+    for old, new in punctuation._load_data()["normalize"].items():
+        text = text.replace(old, new)
+    return text
+
+
+TABLE = str.maketrans(punctuation._load_data()["normalize"])
+
+
+def normalize_translate(text: str) -> str:
+    return text.translate(TABLE)
+
+
+def to_words_loop(text: str) -> str:
+    for punct, word in punctuation._load_data()["to_words"].items():
+        text = text.replace(punct, f" {word} ")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def remove_loop(text: str) -> str:
+    data = punctuation._load_data()
+    for punct in set(data["normalize"]) | set(data["to_words"]):
+        text = text.replace(punct, " ")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+BENCHMARKS = {
+    "normalize": [
+        ("loop", normalize_loop),
+        ("translate", normalize_translate),
+        ("current", punctuation.normalize),
+    ],
+    "to_words": [("loop", to_words_loop), ("current", punctuation.to_words)],
+    "remove": [("loop", remove_loop), ("current", punctuation.remove)],
+}
+
+
+def main():
+    cases = []
+    for label, text in TEXTS.items():
+        cases.append((label, text, 20_000))
+        cases.append((label.replace("sentence", "document"), text * 500, 100))
+
+    for function, variants in BENCHMARKS.items():
+        print(function)
+        for label, text, number in cases:
+            expected = variants[0][1](text)
+            timings = []
+            for name, func in variants:
+                assert func(text) == expected
+                seconds = timeit.timeit(lambda: func(text), number=number) / number
+                timings.append(f"{name} {seconds * 1e6:9.2f} us")
+            print(f"  {label:>16} ({len(text):>5} chars): " + "  ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark IPA to Cyrillic conversion.
+
+Compares the single-pass longest-match scan against the original cascade of
+``str.replace`` calls over ``IPA_MAP_SORTED``, and lists inputs whose output
+changed (the cascade let shorter sequences split longer ones).
+
+Run with: uv run python benchmarks/bench_transliterate.py
+"""
+
+import itertools
+import timeit
+
+from mon_nlp.transliterate import (
+    IPA_MAP,
+    IPA_MAP_SORTED,
+    ipa_to_cyrillic,
+)
+
+TEXTS = {
+    "word": "həloʊ",
+    "sentence": (
+        "ðə beɪʒ hjuː ɑːnðə wɔːɾɚz ʌvðə lɑːx ɪmpɹɛst ɔːl, ɪŋkluːdɪŋ ðə fɹɛntʃ kwiːn, "
+        "bᵻfɔːɹ ʃiː hɜːd ðæt sɪmfəni ɐɡɛn, dʒʌst æz jʌŋ ɑːɹθɚ wɑːntᵻd."
+    ),
+}
+
+
+def ipa_to_cyrillic_cascade(ipa_text: str) -> str:
+    result = ipa_text
+    for ipa_seq, cyrillic in IPA_MAP_SORTED:
+        result = result.replace(ipa_seq, cyrillic)
+    return result
+
+
+def changed_pairs() -> list[tuple[str, str, str]]:
+    """Two-sequence inputs where the cascade and the scan disagree."""
+    sequences = [seq for seq, _ in IPA_MAP]
+    changed = []
+    for first, second in itertools.product(sequences, repeat=2):
+        text = first + second
+        old, new = ipa_to_cyrillic_cascade(text), ipa_to_cyrillic(text)
+        if old != new:
+            changed.append((text, old, new))
+    return sorted(set(changed))
+
+
+def main():
+    for label, text in TEXTS.items():
+        number = 200_000 if label == "word" else 20_000
+        print(f"{label} ({number:,} calls)")
+        times = {}
+        for name, func in [("cascade", ipa_to_cyrillic_cascade), ("scan", ipa_to_cyrillic)]:
+            times[name] = min(timeit.repeat(lambda: func(text), number=number, repeat=3))
+            speedup = times["cascade"] / times[name]
+            print(f"  {name:8} {times[name]:.3f}s  {speedup:.1f}x")
+
+    changed = changed_pairs()
+    print(f"\n{len(changed)} two-sequence inputs changed")
+    for text, old, new in changed:
+        print(f"  {text:6} cascade={old:6} scan={new}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Generate ``src/mon_nlp/data/emoji_ranges.json`` from Unicode emoji properties.
+
+The table covers every Extended_Pictographic code point, the non-ASCII
+Emoji_Component code points (ZWJ, emoji variation selector, keycap, skin tones,
+hair components, regional indicators and tags) and the text variation selector.
+
+Requires the ``regex`` package, which ships the Unicode property data:
+
+    uv run --with regex python scripts/gen_emoji_ranges.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import regex
+
+OUTPUT = Path(__file__).parent.parent / "src" / "mon_nlp" / "data" / "emoji_ranges.json"
+PATTERN = regex.compile(r"[\p{Extended_Pictographic}\p{Emoji_Component}\uFE0E]")
+
+
+def build_ranges() -> list[list[int]]:
+    ranges: list[list[int]] = []
+    for cp in range(0x80, sys.maxunicode + 1):
+        if not PATTERN.match(chr(cp)):
+            continue
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ranges
+
+
+def main():
+    data = {
+        "source": f"Unicode emoji properties via regex {regex.__version__}",
+        "ranges": build_ranges(),
+    }
+    OUTPUT.write_text(json.dumps(data, separators=(",", ":")) + "\n", encoding="utf-8")
+    print(f"Wrote {len(data['ranges'])} ranges to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
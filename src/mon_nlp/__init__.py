@@ -1,18 +1,23 @@
 """Mongolian Cyrillic text normalization and processing library."""
 
+from collections.abc import Iterable
+
 from mon_nlp.abbreviation import AbbreviationExpander
 from mon_nlp.abbreviation import expand as expand_abbreviations
 from mon_nlp.case import to_lowercase, to_sentence_case, to_uppercase
 from mon_nlp.emoji import (
     add_emoji_mapping,
+    add_emoji_mappings,
     emoji_to_words,
     get_emoji_mappings,
     remove_emoji,
     remove_emoji_mapping,
+    remove_emoji_mappings,
 )
 from mon_nlp.g2p import G2P, syllabify
 from mon_nlp.g2p import convert as g2p_convert
-from mon_nlp.number import num2words, roman2num
+from mon_nlp.number import find_number_words, num2words, num2words_batch, roman2num, words2num
+from mon_nlp.number import verbalize_text as verbalize_numbers
 from mon_nlp.punctuation import normalize as normalize_punctuation
 from mon_nlp.punctuation import remove as remove_punctuation
 from mon_nlp.punctuation import to_words as punctuation_to_words
@@ -33,12 +38,18 @@ __all__ = [
     "expand_abbreviations",
     # Number
     "num2words",
+    "num2words_batch",
     "roman2num",
+    "words2num",
+    "find_number_words",
+    "verbalize_numbers",
     # Emoji
     "emoji_to_words",
     "remove_emoji",
     "add_emoji_mapping",
+    "add_emoji_mappings",
     "remove_emoji_mapping",
+    "remove_emoji_mappings",
     "get_emoji_mappings",
     # G2P
     "G2P",
@@ -63,3 +74,70 @@ def transliterate(text: str, language: str = "en-us", output_ipa: bool = False)
     from mon_nlp.transliterate import transliterate as _transliterate
 
     return _transliterate(text, language, output_ipa)
+
+
+def transliterate_many(
+    texts: Iterable[str], language: str = "en-us", output_ipa: bool = False, njobs: int = 1
+) -> list[str]:
+    """Transliterate many English texts to Mongolian Cyrillic with one phonemizer call.
+
+    Requires optional dependency: pip install mon-nlp[transliterate]
+
+    Args:
+        texts: English texts to transliterate
+        language: Source language code (default: "en-us")
+        output_ipa: If True, return IPA instead of Cyrillic
+        njobs: Number of parallel espeak jobs used by phonemizer
+
+    Returns:
+        One transliteration per text, in input order ("" for texts that failed)
+    """
+    from mon_nlp.transliterate import transliterate_many as _transliterate_many
+
+    return _transliterate_many(texts, language, output_ipa, njobs)
+
+
+def transliterate_embedded(text: str, language: str = "en-us", njobs: int = 1) -> str:
+    """Transliterate English words embedded in Mongolian text with one phonemizer call.
+
+    Requires optional dependency: pip install mon-nlp[transliterate]
+
+    Args:
+        text: Mongolian Cyrillic text with embedded Latin-script words
+        language: Source language code of the Latin runs (default: "en-us")
+        njobs: Number of parallel espeak jobs used by phonemizer
+
+    Returns:
+        Text with every Latin run transliterated to Cyrillic
+    """
+    from mon_nlp.transliterate import transliterate_embedded as _transliterate_embedded
+
+    return _transliterate_embedded(text, language, njobs)
+
+
+async def atransliterate(text: str, language: str = "en-us", output_ipa: bool = False) -> str:
+    """Transliterate English text to Mongolian Cyrillic without blocking the event loop.
+
+    Runs on mon_nlp.aio's shared thread pool; concurrent calls are coalesced
+    and batched into one phonemizer call.
+
+    Requires optional dependency: pip install mon-nlp[transliterate]
+
+    Args:
+        text: English text to transliterate
+        language: Source language code (default: "en-us")
+        output_ipa: If True, return IPA instead of Cyrillic
+
+    Returns:
+        Mongolian Cyrillic transliteration, or IPA if output_ipa=True
+    """
+    from mon_nlp.aio import atransliterate as _atransliterate
+
+    return await _atransliterate(text, language, output_ipa)
+
+
+async def ag2p_convert(text: str) -> str:
+    """Convert Mongolian text to phonemes on mon_nlp.aio's shared thread pool."""
+    from mon_nlp.aio import ag2p_convert as _ag2p_convert
+
+    return await _ag2p_convert(text)
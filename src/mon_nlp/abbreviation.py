@@ -2,53 +2,146 @@
 
 import json
 import re
+import time
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
 _DATA_DIR = Path(__file__).parent / "data"
+_SUFFIX_CHARS = "а-яёөү"
 
 
 class AbbreviationExpander:
-    """Expands abbreviations in Mongolian text."""
+    """Expands abbreviations in Mongolian text.
 
-    def __init__(self, custom: dict[str, str] | None = None):
+    Args:
+        custom: Extra abbreviation mappings added on top of the defaults
+        suffixes: If True, also match abbreviations followed by a case suffix
+            (``МУИС-ийн``, ``УБ-д``, ``ТВээр``) and attach the suffix to the
+            expansion (``Монгол Улсын Их Сургуулийн``, ``Улаанбаатард``). The
+            hyphen may only be left out after an all-uppercase abbreviation.
+    """
+
+    def __init__(self, custom: dict[str, str] | None = None, suffixes: bool = False):
         self._abbrevs = self._load_defaults()
         if custom:
             self._abbrevs.update(custom)
+        self._suffixes = suffixes
+        self._version = 0
+        self._pattern: re.Pattern[str] | None = None
+        self._pattern_version = -1
+        self._pattern_count = 0
+        self._build_time = 0.0
 
     def _load_defaults(self) -> dict[str, str]:
         with open(_DATA_DIR / "abbreviations.json", encoding="utf-8") as f:
             return json.load(f)
 
+    def _compile(self) -> re.Pattern[str]:
+        # Longest abbreviations first so the alternation prefers them at each position
+        ordered = sorted(self._abbrevs, key=len, reverse=True)
+        alternation = "|".join(re.escape(abbrev) for abbrev in ordered)
+        if not self._suffixes:
+            return re.compile(rf"\b(?:{alternation})\b")
+        suffix = rf"[{_SUFFIX_CHARS}]+"
+        hyphenated = rf"({alternation})(?:-({suffix}))?"
+        # A suffix may only be attached without a hyphen to an all-uppercase
+        # abbreviation of two or more letters (ТВээр); otherwise "м" would match
+        # the start of "маш" and "Д" the start of "Дорж"
+        upper = "|".join(
+            re.escape(abbrev) for abbrev in ordered if len(abbrev) > 1 and abbrev.isupper()
+        )
+        # (?!) never matches, keeping the group numbers when there is no such abbreviation
+        upper = upper or "(?!)"
+        return re.compile(rf"\b(?:({upper})({suffix})|{hyphenated})\b")
+
+    def _replace(self, match: re.Match[str]) -> str:
+        return self._abbrevs[match.group()]
+
+    def _replace_with_suffix(self, match: re.Match[str]) -> str:
+        abbrev, suffix = match.group(1, 2) if match.group(1) else match.group(3, 4)
+        expansion = self._abbrevs[abbrev]
+        if not suffix:
+            return expansion
+        # Soft sign is dropped before an и-initial suffix: сургууль + ийн -> сургуулийн
+        if expansion.endswith("ь") and suffix.startswith("и"):
+            expansion = expansion[:-1]
+        return expansion + suffix
+
+    def _get_pattern(self) -> re.Pattern[str]:
+        if self._pattern is None or self._pattern_version != self._version:
+            start = time.perf_counter()
+            self._pattern = self._compile()
+            self._build_time = time.perf_counter() - start
+            self._pattern_version = self._version
+            self._pattern_count = len(self._abbrevs)
+        return self._pattern
+
     def expand(self, text: str) -> str:
         """Expand abbreviations in text."""
-        for abbrev, expansion in sorted(self._abbrevs.items(), key=lambda x: -len(x[0])):
-            pattern = rf"\b{re.escape(abbrev)}\b"
-            text = re.sub(pattern, expansion, text)
-        return text
+        if not self._abbrevs:
+            return text
+        replace = self._replace_with_suffix if self._suffixes else self._replace
+        return self._get_pattern().sub(replace, text)
 
     def add(self, abbrev: str, expansion: str) -> None:
         """Add a new abbreviation mapping."""
         self._abbrevs[abbrev] = expansion
+        self._version += 1
 
     def remove(self, abbrev: str) -> None:
         """Remove an abbreviation mapping."""
-        self._abbrevs.pop(abbrev, None)
+        if self._abbrevs.pop(abbrev, None) is not None:
+            self._version += 1
+
+    def update_many(self, mapping: Mapping[str, str]) -> None:
+        """Add or replace many abbreviation mappings at once."""
+        if mapping:
+            self._abbrevs.update(mapping)
+            self._version += 1
+
+    def remove_many(self, abbrevs: Iterable[str]) -> None:
+        """Remove many abbreviation mappings at once."""
+        removed = False
+        for abbrev in abbrevs:
+            removed = self._abbrevs.pop(abbrev, None) is not None or removed
+        if removed:
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every change to the mappings."""
+        return self._version
+
+    @property
+    def build_time(self) -> float:
+        """Seconds spent compiling the current matcher (0.0 before the first build)."""
+        return self._build_time
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of abbreviations in the current compiled matcher."""
+        return self._pattern_count
 
     def get_all(self) -> dict[str, str]:
         """Get all abbreviation mappings."""
         return self._abbrevs.copy()
 
 
-_default_expander: AbbreviationExpander | None = None
+_default_expanders: dict[bool, AbbreviationExpander] = {}
+
 
+def _get_default_expander(suffixes: bool = False) -> AbbreviationExpander:
+    expander = _default_expanders.get(suffixes)
+    if expander is None:
+        expander = _default_expanders[suffixes] = AbbreviationExpander(suffixes=suffixes)
+    return expander
 
-def _get_default_expander() -> AbbreviationExpander:
-    global _default_expander
-    if _default_expander is None:
-        _default_expander = AbbreviationExpander()
-    return _default_expander
 
+def expand(text: str, suffixes: bool = False) -> str:
+    """Expand abbreviations using default mappings.
 
-def expand(text: str) -> str:
-    """Expand abbreviations using default mappings."""
-    return _get_default_expander().expand(text)
+    Args:
+        text: Input text
+        suffixes: If True, keep case suffixes attached to the expansion
+    """
+    return _get_default_expander(suffixes).expand(text)
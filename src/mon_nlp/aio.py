@@ -0,0 +1,227 @@
+"""Asyncio wrappers that keep espeak and G2P off the event loop.
+
+AsyncConverter runs the blocking work on a bounded thread pool. Identical
+requests that are already queued or running share one result, and IPA
+lookups made within a short window are sent to phonemizer as one batch.
+
+Only use an AsyncConverter from one event loop at a time.
+"""
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from mon_nlp import g2p
+from mon_nlp.g2p import G2P
+from mon_nlp.transliterate import (
+    _LATIN_RUN_RE,
+    EnglishToCyrillic,
+    _get_converter,
+    _splice_runs,
+)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_MAX_BATCH = 256
+
+
+class AsyncConverter:
+    """Async transliteration and G2P with request coalescing and micro-batching.
+
+    Args:
+        max_workers: Threads running blocking calls
+        batch_window: Seconds to collect IPA lookups before one phonemizer call
+        max_batch: Texts per phonemizer call; a full batch is sent right away
+        transliterator: EnglishToCyrillic to use; the module default if None
+        converter: G2P to use; the module default (with its word cache) if None
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        transliterator: EnglishToCyrillic | None = None,
+        converter: G2P | None = None,
+    ):
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mon-nlp")
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self._transliterator = transliterator
+        self._g2p_convert = g2p.convert if converter is None else converter.convert
+        # Event loop the state below belongs to; futures and timers cannot be
+        # shared between loops, e.g. across asyncio.run calls
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Futures of requests that are queued or running, keyed by request
+        self._pending: dict[Hashable, asyncio.Future[Any]] = {}
+        # Texts waiting for the next phonemizer call, and its timer, per language
+        self._batches: dict[str, list[str]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    @property
+    def transliterator(self) -> EnglishToCyrillic:
+        """EnglishToCyrillic the IPA batches run on."""
+        if self._transliterator is None:
+            self._transliterator = _get_converter()
+        return self._transliterator
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Running loop, dropping requests and batches left over from another loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._pending = {}
+            self._batches = {}
+            self._timers = {}
+            self._loop = loop
+        return loop
+
+    async def run(self, func: Callable[..., T], *args: Hashable) -> T:
+        """Run func(*args) on the thread pool, sharing the result with identical calls.
+
+        Args:
+            func: Blocking function, e.g. any mon_nlp normalizer
+            *args: Hashable arguments
+
+        Returns:
+            func(*args)
+        """
+        loop = self._get_loop()
+        key = (func, args)
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.run_in_executor(self._executor, func, *args)
+            self._pending[key] = future
+            future.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shielded, so a cancelled caller does not cancel the others' result
+        return await asyncio.shield(future)
+
+    async def get_ipa(self, text: str, language: str = "en-us") -> str:
+        """IPA for English text, phonemized in a batch with concurrent lookups."""
+        loop = self._get_loop()
+        key = ("ipa", language, text)
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            batch = self._batches.setdefault(language, [])
+            batch.append(text)
+            if len(batch) >= self._max_batch:
+                self._flush(language)
+            elif len(batch) == 1:
+                self._timers[language] = loop.call_later(self._batch_window, self._flush, language)
+        return await asyncio.shield(future)
+
+    def _flush(self, language: str) -> None:
+        timer = self._timers.pop(language, None)
+        if timer is not None:
+            timer.cancel()
+        texts = self._batches.pop(language, [])
+        if not texts:
+            return
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(
+            self._executor, self.transliterator.get_ipa_many, texts, language
+        )
+        task.add_done_callback(partial(self._resolve, language, texts))
+
+    def _resolve(self, language: str, texts: list[str], task: asyncio.Future[list[str]]) -> None:
+        futures = [self._pending.pop(("ipa", language, text)) for text in texts]
+        # task.exception() raises if the phonemizer call was cancelled, so
+        # check that first; waiters would otherwise never be resolved
+        if task.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        error = task.exception()
+        if error is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for future, ipa in zip(futures, task.result()):
+            if not future.done():
+                future.set_result(ipa)
+
+    async def transliterate(
+        self, text: str, language: str = "en-us", output_ipa: bool = False
+    ) -> str:
+        """Async EnglishToCyrillic.transliterate."""
+        ipa = await self.get_ipa(text, language)
+        if not ipa:
+            return ""
+        return ipa if output_ipa else self.transliterator.ipa_to_cyrillic(ipa)
+
+    async def transliterate_many(
+        self, texts: Iterable[str], language: str = "en-us", output_ipa: bool = False
+    ) -> list[str]:
+        """Async EnglishToCyrillic.transliterate_many."""
+        return list(
+            await asyncio.gather(
+                *(self.transliterate(text, language, output_ipa) for text in texts)
+            )
+        )
+
+    async def transliterate_embedded(self, text: str, language: str = "en-us") -> str:
+        """Async EnglishToCyrillic.transliterate_embedded."""
+        matches = list(_LATIN_RUN_RE.finditer(text))
+        if not matches:
+            return text
+        runs = list(dict.fromkeys(match.group() for match in matches))
+        cyrillic = dict(zip(runs, await self.transliterate_many(runs, language)))
+        return _splice_runs(text, matches, cyrillic)
+
+    async def g2p_convert(self, text: str) -> str:
+        """Async G2P.convert."""
+        return await self.run(self._g2p_convert, text)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the thread pool."""
+        self._executor.shutdown(wait=wait)
+
+
+_default_converter: AsyncConverter | None = None
+
+
+def _get_async_converter() -> AsyncConverter:
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = AsyncConverter()
+    return _default_converter
+
+
+async def atransliterate(text: str, language: str = "en-us", output_ipa: bool = False) -> str:
+    """Transliterate English text to Mongolian Cyrillic without blocking the event loop."""
+    return await _get_async_converter().transliterate(text, language, output_ipa)
+
+
+async def atransliterate_many(
+    texts: Iterable[str], language: str = "en-us", output_ipa: bool = False
+) -> list[str]:
+    """Transliterate many English texts without blocking the event loop."""
+    return await _get_async_converter().transliterate_many(texts, language, output_ipa)
+
+
+async def atransliterate_embedded(text: str, language: str = "en-us") -> str:
+    """Transliterate the Latin-script runs inside text without blocking the event loop."""
+    return await _get_async_converter().transliterate_embedded(text, language)
+
+
+async def ag2p_convert(text: str) -> str:
+    """Convert Mongolian text to phonemes without blocking the event loop."""
+    return await _get_async_converter().g2p_convert(text)
+
+
+async def arun(func: Callable[..., T], *args: Hashable) -> T:
+    """Run any blocking mon_nlp function on the shared thread pool.
+
+    Example: await arun(verbalize_numbers, text)
+    """
+    return await _get_async_converter().run(func, *args)
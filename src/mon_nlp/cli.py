@@ -40,11 +40,8 @@ def cmd_num(args):
 
     num_str = args.number
     try:
-        if "." in num_str or "," in num_str:
-            num = float(num_str.replace(",", "."))
-        else:
-            num = int(num_str)
-        print(number.num2words(num, by_n_digits=args.by_digits, use_dot=args.use_dot))
+        # Strings keep every fraction digit ("3,10" stays exact, no float round-trip)
+        print(number.num2words(num_str, by_n_digits=args.by_digits, use_dot=args.use_dot))
     except ValueError:
         print(f"Error: Invalid number '{num_str}'", file=sys.stderr)
         sys.exit(1)
@@ -58,16 +55,37 @@ def cmd_emoji(args):
 
 
 def cmd_transliterate(args):
-    from mon_nlp.transliterate import transliterate
+    from mon_nlp.transliterate import EnglishToCyrillic
 
     text = " ".join(args.text) if args.text else sys.stdin.read().strip()
     try:
-        print(transliterate(text, language=args.language, output_ipa=args.ipa))
+        converter = EnglishToCyrillic(cache=args.cache)
+        if args.embedded:
+            print(converter.transliterate_embedded(text, language=args.language))
+        else:
+            print(converter.transliterate(text, language=args.language, output_ipa=args.ipa))
     except ImportError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def cmd_ipa_cache(args):
+    from mon_nlp.ipa_cache import IPACache
+    from mon_nlp.transliterate import EnglishToCyrillic
+
+    with open(args.words, encoding="utf-8") as f:
+        words = [line.strip() for line in f]
+    with IPACache(args.cache, max_entries=args.max_entries) as cache:
+        try:
+            added = EnglishToCyrillic(cache=cache).warm_cache(
+                words, language=args.language, njobs=args.njobs
+            )
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Added {added} words to {args.cache} ({len(cache)} entries)")
+
+
 def cmd_g2p(args):
     from mon_nlp import g2p
 
@@ -75,6 +93,26 @@ def cmd_g2p(args):
     print(g2p.convert(text))
 
 
+def cmd_lexicon(args):
+    from mon_nlp.lexicon import build_lexicon
+
+    with open(args.words, encoding="utf-8") as f:
+        words = [line.strip() for line in f]
+    overrides = {}
+    if args.overrides:
+        with open(args.overrides, encoding="utf-8") as f:
+            for line in f:
+                word, sep, phonemes = line.rstrip("\n").partition("\t")
+                if sep:
+                    overrides[word] = phonemes
+    try:
+        count = build_lexicon(words, args.output, overrides=overrides)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {count} entries to {args.output}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="mon-nlp",
@@ -131,13 +169,37 @@ def main():
     p_trans.add_argument("text", nargs="*", help="English text")
     p_trans.add_argument("--language", "-l", default="en-us", help="Source language")
     p_trans.add_argument("--ipa", "-i", action="store_true", help="Output IPA instead of Cyrillic")
+    p_trans.add_argument(
+        "--embedded", "-e", action="store_true", help="Only transliterate Latin runs in the text"
+    )
+    p_trans.add_argument("--cache", "-c", help="Word IPA cache database to read and fill")
     p_trans.set_defaults(func=cmd_transliterate)
 
+    # ipa-cache
+    p_ipa_cache = subparsers.add_parser("ipa-cache", help="Pre-warm a transliteration IPA cache")
+    p_ipa_cache.add_argument("words", help="Word list file, one word per line")
+    p_ipa_cache.add_argument("cache", help="Cache database to create or fill")
+    p_ipa_cache.add_argument("--language", "-l", default="en-us", help="Source language")
+    p_ipa_cache.add_argument(
+        "--max-entries", "-m", type=int, help="Drop least recently used words beyond this"
+    )
+    p_ipa_cache.add_argument("--njobs", "-j", type=int, default=1, help="Parallel espeak jobs")
+    p_ipa_cache.set_defaults(func=cmd_ipa_cache)
+
     # g2p
     p_g2p = subparsers.add_parser("g2p", help="Grapheme to phoneme conversion")
     p_g2p.add_argument("text", nargs="*", help="Mongolian text")
     p_g2p.set_defaults(func=cmd_g2p)
 
+    # lexicon
+    p_lexicon = subparsers.add_parser("lexicon", help="Build a binary G2P lexicon")
+    p_lexicon.add_argument("words", help="Word list file, one word per line")
+    p_lexicon.add_argument("output", help="Lexicon file to write")
+    p_lexicon.add_argument(
+        "--overrides", "-o", help="Tab-separated word and phonemes lines that replace the rules"
+    )
+    p_lexicon.set_defaults(func=cmd_lexicon)
+
     args = parser.parse_args()
     args.func(args)
 
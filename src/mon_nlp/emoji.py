@@ -2,11 +2,22 @@
 
 import json
 import re
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Literal
 
 _DATA_DIR = Path(__file__).parent / "data"
 _EMOJI_DATA: dict[str, str] | None = None
+_EMOJI_GENERATION = 0
+_EMOJI_PATTERN: re.Pattern[str] | None = None
+_EMOJI_PATTERN_GENERATION = -1
+# False when a custom mapping key has no emoji codepoint, so the fast reject can't be used
+_EMOJI_FAST_REJECT = True
+_REMOVE_PATTERN: re.Pattern[str] | None = None
+_NON_EMOJI_PATTERN: re.Pattern[str] | None = None
+
+# Blocks checked by the fast reject: ASCII, Latin-1, Cyrillic and general punctuation
+_FAST_REJECT_BLOCKS = [(0x0000, 0x052F), (0x2000, 0x206F)]
 
 FormatType = Literal["plain", "brackets", "parentheses"]
 
@@ -20,6 +31,22 @@ def _load_data() -> dict[str, str]:
     return _EMOJI_DATA
 
 
+def _get_pattern() -> re.Pattern[str]:
+    global _EMOJI_PATTERN, _EMOJI_PATTERN_GENERATION, _EMOJI_FAST_REJECT
+    if _EMOJI_PATTERN is None or _EMOJI_PATTERN_GENERATION != _EMOJI_GENERATION:
+        data = _load_data()
+        _, non_emoji = _get_remove_patterns()
+        _EMOJI_FAST_REJECT = all(non_emoji.fullmatch(e) is None for e in data)
+        if data:
+            # Longest sequences first so ZWJ and skin-tone sequences win over their parts
+            alternation = "|".join(re.escape(e) for e in sorted(data, key=len, reverse=True))
+        else:
+            alternation = "(?!)"
+        _EMOJI_PATTERN = re.compile(alternation)
+        _EMOJI_PATTERN_GENERATION = _EMOJI_GENERATION
+    return _EMOJI_PATTERN
+
+
 def _format_word(word: str, fmt: FormatType) -> str:
     if fmt == "brackets":
         return f"[{word}]"
@@ -39,43 +66,104 @@ def emoji_to_words(text: str, format: FormatType = "plain") -> str:
         Text with emojis replaced by Mongolian words
     """
     data = _load_data()
-    for emoji, word in data.items():
-        replacement = _format_word(word, format)
-        text = text.replace(emoji, f" {replacement} ")
+    pattern = _get_pattern()
+    # Text with no codepoint from the emoji ranges can't contain a mapped emoji
+    if not _EMOJI_FAST_REJECT or _get_remove_patterns()[1].fullmatch(text) is None:
+        text = pattern.sub(lambda m: f" {_format_word(data[m.group()], format)} ", text)
     # Clean up multiple spaces
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
-
-def remove_emoji(text: str) -> str:
-    """Remove all emojis from text."""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001f600-\U0001f64f"
-        "\U0001f300-\U0001f5ff"
-        "\U0001f680-\U0001f6ff"
-        "\U0001f1e0-\U0001f1ff"
-        "\U00002702-\U000027b0"
-        "\U0001f900-\U0001f9ff"
-        "\U0001fa00-\U0001fa6f"
-        "\U0001fa70-\U0001faff"
-        "\U00002600-\U000026ff"
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub("", text)
+    return " ".join(text.split())
+
+
+def _char_class(ranges: list[tuple[int, int]]) -> str:
+    return "".join(f"\\U{start:08x}-\\U{end:08x}" for start, end in ranges)
+
+
+def _subtract_ranges(
+    blocks: list[tuple[int, int]], ranges: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    result = []
+    for block_start, block_end in blocks:
+        start = block_start
+        for range_start, range_end in ranges:
+            if range_end < start or range_start > block_end:
+                continue
+            if range_start > start:
+                result.append((start, range_start - 1))
+            start = range_end + 1
+        if start <= block_end:
+            result.append((start, block_end))
+    return result
+
+
+def _get_remove_patterns() -> tuple[re.Pattern[str], re.Pattern[str]]:
+    global _REMOVE_PATTERN, _NON_EMOJI_PATTERN
+    if _REMOVE_PATTERN is None or _NON_EMOJI_PATTERN is None:
+        with open(_DATA_DIR / "emoji_ranges.json", encoding="utf-8") as f:
+            ranges = [(start, end) for start, end in json.load(f)["ranges"]]
+        bmp = [(start, end) for start, end in ranges if end < 0x10000]
+        astral = [(start, end) for start, end in ranges if start >= 0x10000]
+        # re tests astral ranges one by one, so a cheap leading guard keeps ordinary
+        # text on the fast BMP charset; keycaps start with ASCII and are matched whole.
+        _REMOVE_PATTERN = re.compile(
+            rf"(?=[#*0-9{_char_class(bmp)}\U00010000-\U0010ffff])"
+            rf"(?:[#*0-9]\ufe0f?\u20e3"
+            rf"|(?:[{_char_class(bmp)}]|(?=[\U00010000-\U0010ffff])[{_char_class(astral)}])+)"
+        )
+        allowed = _subtract_ranges(_FAST_REJECT_BLOCKS, ranges)
+        _NON_EMOJI_PATTERN = re.compile(rf"[{_char_class(allowed)}]*")
+    return _REMOVE_PATTERN, _NON_EMOJI_PATTERN
+
+
+def remove_emoji(text: str, fast_reject: bool = True) -> str:
+    """Remove all emojis from text.
+
+    Removes every Extended_Pictographic character together with emoji
+    components (ZWJ, variation selectors, skin tones, tags, regional
+    indicators) and whole keycap sequences.
+
+    Args:
+        text: Input text
+        fast_reject: Return text unchanged without running the emoji pattern
+            when it only contains ASCII, Cyrillic and common punctuation
+    """
+    pattern, non_emoji = _get_remove_patterns()
+    if fast_reject and non_emoji.fullmatch(text) is not None:
+        return text
+    return pattern.sub("", text)
 
 
 def add_emoji_mapping(emoji: str, description: str) -> None:
     """Add a custom emoji mapping."""
-    data = _load_data()
-    data[emoji] = description
+    add_emoji_mappings({emoji: description})
+
+
+def add_emoji_mappings(mappings: Mapping[str, str]) -> None:
+    """Add many custom emoji mappings, rebuilding the replacer only once."""
+    global _EMOJI_GENERATION
+    if mappings:
+        _load_data().update(mappings)
+        _EMOJI_GENERATION += 1
 
 
 def remove_emoji_mapping(emoji: str) -> None:
     """Remove an emoji mapping."""
+    remove_emoji_mappings([emoji])
+
+
+def remove_emoji_mappings(emojis: Iterable[str]) -> None:
+    """Remove many emoji mappings, rebuilding the replacer only once."""
+    global _EMOJI_GENERATION
     data = _load_data()
-    data.pop(emoji, None)
+    removed = False
+    for emoji in emojis:
+        removed = data.pop(emoji, None) is not None or removed
+    if removed:
+        _EMOJI_GENERATION += 1
+
+
+def get_emoji_generation() -> int:
+    """Get the counter incremented on every change to the emoji mappings."""
+    return _EMOJI_GENERATION
 
 
 def get_emoji_mappings() -> dict[str, str]:
@@ -1,5 +1,18 @@
 """Mongolian Cyrillic grapheme-to-phoneme converter."""
 
+import itertools
+import os
+import re
+import threading
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from mon_nlp.lexicon import Lexicon
+
 VOWELS_NORMAL = "аэиоуөүый"
 VOWELS_YA = "яеёю"
 VOWELS_MASCULINE = "аоуяёю"
@@ -90,86 +103,307 @@ SINGLE_VOWELS = [
 G_SPECIAL = [("га", "G-а"), ("го", "G-о"), ("гу", "G-у"), ("гы", "G-ы")]
 IA_VOWELS = [("иа", "A:"), ("ио", "O:"), ("иу", "U:")]
 
+_YA_PLAIN = {cy: ph[-1] for cy, ph in YA_VOWELS}
+
+
+class _TranslateTable(dict):
+    """str.translate table that maps characters it does not list to a default.
+
+    Whitespace maps to itself, so a table can run over a whole text before
+    str.split(). Each result is stored on first sight, so later lookups stay in C.
+    """
+
+    def __init__(self, mapping: dict[int, str | None], default: str | None):
+        super().__init__(mapping)
+        self.default = default
+
+    def __missing__(self, key: int) -> str | None:
+        char = chr(key)
+        value = char if char.isspace() else self.default
+        self[key] = value
+        return value
+
+
+_LOWER_TABLE = str.maketrans(ALPHABETS_UPPER, ALPHABETS_LOWER)
+# Lowercases and drops everything outside the alphabet except whitespace, like
+# filtering word.lower() for each word of text.split()
+_CLEAN_TABLE = _TranslateTable(
+    {**str.maketrans(ALPHABETS_UPPER, ALPHABETS_LOWER), **{ord(c): c for c in ALPHABETS_LOWER}},
+    None,
+)
+# One class letter per character: vowel, я/е/ё/ю, consonant, sign, or "." for anything else
+_CHAR_CLASSES = _TranslateTable(
+    str.maketrans(
+        VOWELS_NORMAL + VOWELS_YA + CONSONANTS + SIGNS,
+        "v" * len(VOWELS_NORMAL) + "y" * len(VOWELS_YA) + "c" * len(CONSONANTS) + "s" * len(SIGNS),
+    ),
+    ".",
+)
+_SYLLABLE_START_RE = re.compile(r"(?<=.)c(?=[vy])|(?<=[sv])y", re.DOTALL)
+
+_PhonemeTables = tuple[dict[str, tuple[Any, int, int]], dict[str, Any], Any, Any]
+
+_PHONEME_TABLES: dict[tuple[bool, bool, bool], _PhonemeTables] = {}
+
+
+def _phoneme_name(piece: str) -> tuple[str, int]:
+    """Split a rewritten piece such as "ay1-" into ("ay", 1) (internal)."""
+    name = piece.rstrip("-")
+    if name[-1] in "01":
+        return name[:-1], int(name[-1])
+    return name, 0
+
+
+def _phoneme_tables(is_masculine: bool, stressed: bool, ids: bool = False) -> _PhonemeTables:
+    """Rewrite tables for one syllable scan, built once per form.
+
+    Returns (pairs, singles, ng, glide). Two-character rules map to (phoneme,
+    characters consumed, priority). Rules that keep their vowel ("би" -> "B-и")
+    consume only the consonant, so the vowel is rewritten next. Priority follows
+    the order the tables were once applied in with str.replace. With ids=True
+    every phoneme string becomes a (phoneme ID, stress) pair.
+    """
+    key = (is_masculine, stressed, ids)
+    tables = _PHONEME_TABLES.get(key)
+    if tables is None:
+        if ids:
+            pairs, singles, ng, glide = _phoneme_tables(is_masculine, stressed)
+            id_pairs = {cy: (_phoneme_id(ph), n, rank) for cy, (ph, n, rank) in pairs.items()}
+            id_singles = {cy: _phoneme_id(ph) for cy, ph in singles.items()}
+            id_singles.update((char, (PHONEME_IDS[char], 0)) for char in _PASSTHROUGH_LETTERS)
+            tables = (id_pairs, id_singles, _phoneme_id(ng), _phoneme_id(glide))
+        else:
+            stress = "1-" if stressed else "0-"
+            rules = [*CONSONANTS_SOFT_I] if is_masculine else []
+            rules += CONSONANTS_SOFT_SIGN + G_SPECIAL
+            rules += [(cy, ph + stress) for cy, ph in IA_VOWELS + DOUBLE_VOWELS]
+            str_pairs: dict[str, tuple[str, int, int]] = {}
+            for rank, (cy, ph) in enumerate(rules):
+                if ph.endswith(cy[1]):
+                    str_pairs.setdefault(cy, (ph[:-1], 1, rank))
+                else:
+                    str_pairs.setdefault(cy, (ph, 2, rank))
+            str_singles = {cy: ph + stress for cy, ph in SINGLE_VOWELS}
+            str_singles.update(CONSONANTS_REGULAR)
+            tables = (str_pairs, str_singles, "ng-", "j-")
+        _PHONEME_TABLES[key] = tables
+    return tables
+
+
+def _phoneme_id(piece: str) -> tuple[int, int]:
+    name, stress = _phoneme_name(piece)
+    return PHONEME_IDS[name], stress
+
+
+def _scan_syllable(syl: str, tables: _PhonemeTables, result: list) -> None:
+    """Rewrite one syllable left to right, appending one piece per phoneme (internal)."""
+    pairs, singles, ng, glide = tables
+    length = len(syl)
+    ng_pending = True
+    i = 0
+    while i < length:
+        char = syl[i]
+        # Only the first н at the end or before a consonant becomes ng
+        if char == "н" and ng_pending and (i + 1 == length or syl[i + 1] in CONSONANTS):
+            result.append(ng)
+            ng_pending = False
+            i += 1
+            continue
+
+        vowel = _YA_PLAIN.get(char)
+        if vowel is not None:
+            # е after consonants becomes э, other я/е/ё/ю get a j- glide
+            if not (char == "е" and i and syl[i - 1] in CONSONANTS):
+                result.append(glide)
+            char = vowel
+
+        rule = pairs.get(char + syl[i + 1 : i + 2])
+        if rule is not None:
+            phoneme, consumed, rank = rule
+            # A higher-priority pair on the next two characters claims them first
+            # ("аай" is а + ай, as in the ordered rule tables)
+            blocker = pairs.get(syl[i + 1 : i + 3]) if consumed == 2 else None
+            if blocker is None or blocker[2] >= rank:
+                result.append(phoneme)
+                i += consumed
+                continue
+
+        result.append(singles.get(char, char))
+        i += 1
+
+
+def _build_inventory() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Phoneme names in ID order, and the letters passed through unchanged."""
+    names = ["<pad>"]
+    passthrough = []
+    for is_masculine in (True, False):
+        pairs, singles, ng, glide = _phoneme_tables(is_masculine, False)
+        pieces = [ph for ph, _, _ in pairs.values()] + list(singles.values()) + [ng, glide]
+        names.extend(_phoneme_name(piece)[0] for piece in pieces)
+        passthrough.extend(c for c in ALPHABETS_LOWER if c not in singles and c not in _YA_PLAIN)
+    return tuple(dict.fromkeys(names + passthrough)), tuple(dict.fromkeys(passthrough))
+
+
+PHONEME_INVENTORY, _PASSTHROUGH_LETTERS = _build_inventory()
+PHONEME_IDS = {name: i for i, name in enumerate(PHONEME_INVENTORY)}
+
+
+def _phoneme_string_ids(phonemes: str) -> list[list[tuple[int, int]]]:
+    """Read one word's phoneme string ("s-ay1-ng|") as (ID, stress) pairs per syllable.
+
+    Lexicon entries are stored as strings. Raises ValueError for a phoneme
+    missing from PHONEME_INVENTORY (internal).
+    """
+    syllables = []
+    for syllable in phonemes.split("|"):
+        if not syllable:
+            continue
+        pieces = []
+        for piece in syllable.split("-"):
+            if not piece:
+                continue
+            name, stress = _phoneme_name(piece)
+            phoneme_id = PHONEME_IDS.get(name)
+            if phoneme_id is None or phoneme_id == 0:
+                raise ValueError(f"Unknown phoneme {name!r} in {phonemes!r}")
+            pieces.append((phoneme_id, stress))
+        syllables.append(pieces)
+    return syllables
+
+
+class PhonemeIds(NamedTuple):
+    """Phoneme IDs of a text with per-phoneme boundary markers.
+
+    All four arrays have one entry per phoneme. IDs index PHONEME_INVENTORY
+    (0 is padding); stress is 1 on vowels of stressed syllables; syllable_ends
+    and word_ends are 1 on the last phoneme of each syllable and word.
+    """
+
+    ids: array
+    stress: array
+    syllable_ends: array
+    word_ends: array
+
+
+def pad_phoneme_ids(batch: Sequence[PhonemeIds], pad_id: int = 0) -> Any:
+    """Stack the IDs of a batch into one 2-D uint16 NumPy array, padded with pad_id.
+
+    Requires NumPy.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy package is required for padded phoneme ID batches. "
+            "Install with: pip install numpy"
+        )
+    width = max((len(item.ids) for item in batch), default=0)
+    padded = np.full((len(batch), width), pad_id, dtype=np.uint16)
+    for row, item in enumerate(batch):
+        padded[row, : len(item.ids)] = np.frombuffer(item.ids, dtype=np.uint16)
+    return padded
+
+
 PO_VOWELS = "aeiou^@y"
 PO_BACK_MASCULINE = "aou"
 PO_FRONT_MASCULINE = "AOU"
 
 
+DEFAULT_CACHE_SIZE = 8192
+
+
 class G2P:
-    """Grapheme-to-phoneme converter for Mongolian Cyrillic."""
+    """Grapheme-to-phoneme converter for Mongolian Cyrillic.
+
+    Args:
+        cache_size: Number of converted words to keep in an LRU cache keyed on
+            the cleaned word; 0 disables the cache
+        lexicon: Lexicon (or path to a file written by build_lexicon) consulted
+            before the rules; words it lacks are converted by the rules
+    """
+
+    def __init__(
+        self, cache_size: int = 0, lexicon: Lexicon | str | os.PathLike[str] | None = None
+    ):
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+        if lexicon is not None and not isinstance(lexicon, Lexicon):
+            lexicon = Lexicon(lexicon)
+        self._lexicon = lexicon
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    @property
+    def lexicon(self) -> Lexicon | None:
+        """Precompiled lexicon consulted before the rules, if any."""
+        return self._lexicon
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of cached words (0 when caching is off)."""
+        return self._cache_size
+
+    @property
+    def cache_hits(self) -> int:
+        """Words served from the cache."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Words converted because they were not cached."""
+        return self._cache_misses
+
+    @property
+    def cache_evictions(self) -> int:
+        """Least recently used words dropped to stay within cache_size."""
+        return self._cache_evictions
+
+    def set_cache_size(self, cache_size: int) -> None:
+        """Resize the word cache; 0 disables it.
+
+        Least recently used words that no longer fit are dropped.
+        """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+        with self._cache_lock:
+            self._cache_size = cache_size
+            while len(self._cache) > cache_size:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
+
+    def clear_cache(self) -> None:
+        """Drop all cached words and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._cache_evictions = 0
 
     def syllabify(self, text: str) -> list[str]:
         """Split text into syllables (handles multiple words)."""
         if not text:
             return [""]
-        words = text.split()
+        words = text.translate(_LOWER_TABLE).split()
         all_syllables = []
         for word in words:
             all_syllables.extend(self._syllabify_word(word))
         return all_syllables
 
-    def _to_lower(self, text: str) -> str:
-        result = []
-        for char in text:
-            idx = ALPHABETS_UPPER.find(char)
-            result.append(ALPHABETS_LOWER[idx] if idx >= 0 else char)
-        return "".join(result)
-
     def _syllable_to_phoneme(self, syl: str, is_masculine: bool, stressed: bool) -> str:
-        # Handle н at end or before consonants
-        for i in range(len(syl)):
-            if syl[i] == "н":
-                if i + 1 == len(syl):
-                    syl = syl[:i] + "ng-"
-                    break
-                if i + 1 < len(syl) and syl[i + 1] in CONSONANTS:
-                    syl = syl[:i] + "ng-" + syl[i + 1 :]
-                    break
-
-        if is_masculine:
-            for cy, ph in CONSONANTS_SOFT_I:
-                syl = syl.replace(cy, ph)
-
-        for cy, ph in CONSONANTS_SOFT_SIGN:
-            syl = syl.replace(cy, ph)
-
-        for cy, ph in G_SPECIAL:
-            syl = syl.replace(cy, ph)
-
-        # е after consonants becomes э
-        syl_list = list(syl)
-        for i in range(1, len(syl_list)):
-            if syl_list[i] == "е" and syl[i - 1] in CONSONANTS:
-                syl_list[i] = "э"
-        syl = "".join(syl_list)
-
-        for cy, ph in YA_VOWELS:
-            syl = syl.replace(cy, ph)
-
-        stress = "1-" if stressed else "0-"
+        result: list[str] = []
+        _scan_syllable(syl, _phoneme_tables(is_masculine, stressed), result)
+        phonemes = "".join(result)
+        if phonemes.endswith("-"):
+            phonemes = phonemes[:-1]
 
-        for cy, ph in IA_VOWELS:
-            syl = syl.replace(cy, ph + stress)
+        return phonemes
 
-        for cy, ph in DOUBLE_VOWELS:
-            syl = syl.replace(cy, ph + stress)
-
-        for cy, ph in SINGLE_VOWELS:
-            syl = syl.replace(cy, ph + stress)
-
-        for cy, ph in CONSONANTS_REGULAR:
-            syl = syl.replace(cy, ph)
-
-        if syl.endswith("-"):
-            syl = syl[:-1]
-
-        return syl
-
-    def _convert_syllables(self, syllables: list[str]) -> str:
-        if not syllables:
-            return ""
-
-        result = []
+    def _syllable_forms(self, syllables: list[str]) -> Iterator[tuple[str, bool, bool]]:
+        """Yield (syllable, is_masculine, stressed) for each non-empty syllable (internal)."""
         masculine = False
 
         for i, syl in enumerate(syllables):
@@ -186,45 +420,165 @@ class G2P:
                 if i + 1 < len(syllables) and syllables[i + 1] and syllables[i + 1][0] in VOWELS_YA:
                     syl = syl[:-1]
 
-            result.append(self._syllable_to_phoneme(syl, masculine, i == 0))
+            yield syl, masculine, i == 0
+
+    def _convert_syllables(self, syllables: list[str]) -> str:
+        if not syllables:
+            return ""
+
+        result = [
+            self._syllable_to_phoneme(syl, masculine, stressed)
+            for syl, masculine, stressed in self._syllable_forms(syllables)
+        ]
 
         return "|".join(result) + "|"
 
     def convert(self, text: str) -> str:
         """Convert text to phoneme representation."""
-        words = text.split()
+        # Cleaning the whole text keeps whitespace, so split() yields the non-empty cleaned words
+        return "*".join([self._convert_word(word) for word in text.translate(_CLEAN_TABLE).split()])
+
+    def convert_ids(self, text: str) -> PhonemeIds:
+        """Convert text to phoneme IDs with stress, syllable and word markers.
+
+        Same phonemes as convert, lexicon entries included, written straight
+        into arrays instead of the "-", "|" and "*" delimited string.
+        """
+        ids = array("H")
+        stress = array("B")
+        syllable_ends = array("B")
+        word_ends = array("B")
+        scanned: list[tuple[int, int]] = []
+        for word in text.translate(_CLEAN_TABLE).split():
+            phonemes = None if self._lexicon is None else self._lexicon.get(word)
+            # Lexicon entries are parsed from their stored string, other words scanned
+            syllables: Iterable[Any] = (
+                self._syllable_forms(self._syllabify_word(word))
+                if phonemes is None
+                else _phoneme_string_ids(phonemes)
+            )
+            for syllable in syllables:
+                if phonemes is None:
+                    syl, masculine, stressed = syllable
+                    scanned.clear()
+                    _scan_syllable(syl, _phoneme_tables(masculine, stressed, ids=True), scanned)
+                    pieces = scanned
+                else:
+                    pieces = syllable
+                if not pieces:
+                    continue
+                syllable_ids, syllable_stress = zip(*pieces)
+                ids.extend(syllable_ids)
+                stress.extend(syllable_stress)
+                syllable_ends.frombytes(bytes(len(pieces) - 1))
+                syllable_ends.append(1)
+            if len(word_ends) < len(ids):
+                word_ends.frombytes(bytes(len(ids) - len(word_ends) - 1))
+                word_ends.append(1)
+        return PhonemeIds(ids, stress, syllable_ends, word_ends)
+
+    def convert_many(
+        self, texts: Iterable[str], workers: int | None = 1, chunksize: int = 1000
+    ) -> Iterator[str]:
+        """Convert many texts, yielding results in input order.
+
+        Texts are read lazily in chunks of chunksize; each distinct word is
+        converted once per chunk. With workers > 1 chunks run in a process
+        pool, with at most two chunks per worker in flight; each worker has its
+        own word cache and maps this converter's lexicon file, if any.
+
+        Args:
+            texts: Iterable of texts, e.g. lines of a corpus file
+            workers: Number of processes; 1 converts in this process and None
+                uses os.cpu_count()
+            chunksize: Number of texts sent to a worker at a time
+
+        Yields:
+            Phoneme representation of each text
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+
+        iterator = iter(texts)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+        if workers == 1:
+            for chunk in chunks:
+                yield from self._convert_chunk(chunk)
+            return
+
+        lexicon_path = None if self._lexicon is None else self._lexicon.path
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._cache_size, lexicon_path),
+        ) as executor:
+            pending: deque[Future[list[str]]] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_convert_chunk_in_worker, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _convert_chunk(self, texts: list[str]) -> list[str]:
+        """Convert a list of texts, converting each distinct word once (internal)."""
+        words: dict[str, str] = {}
         results = []
-        for word in words:
-            cleaned = "".join(c for c in word.lower() if c in ALPHABETS_LOWER)
-            if cleaned:
-                syllables = self._syllabify_word(cleaned)
-                results.append(self._convert_syllables(syllables))
-        return "*".join(results)
+        for text in texts:
+            parts = []
+            for word in text.translate(_CLEAN_TABLE).split():
+                phonemes = words.get(word)
+                if phonemes is None:
+                    phonemes = words[word] = self._convert_word(word)
+                parts.append(phonemes)
+            results.append("*".join(parts))
+        return results
+
+    def _convert_word(self, word: str) -> str:
+        """Convert one cleaned word, through the LRU cache when enabled (internal)."""
+        if not self._cache_size:
+            return self._lookup_word(word)
+
+        cache = self._cache
+        with self._cache_lock:
+            phonemes = cache.get(word)
+            if phonemes is not None:
+                cache.move_to_end(word)
+                self._cache_hits += 1
+                return phonemes
+            self._cache_misses += 1
+
+        # Convert outside the lock; a concurrent miss on the same word stores the same value
+        phonemes = self._lookup_word(word)
+        with self._cache_lock:
+            cache[word] = phonemes
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+                self._cache_evictions += 1
+        return phonemes
+
+    def _lookup_word(self, word: str) -> str:
+        """Lexicon entry for a cleaned word, else its rule-based conversion (internal)."""
+        if self._lexicon is not None:
+            phonemes = self._lexicon.get(word)
+            if phonemes is not None:
+                return phonemes
+        return self._convert_syllables(self._syllabify_word(word))
 
     def _syllabify_word(self, word: str) -> list[str]:
-        """Split a single word into syllables (internal)."""
-        word = self._to_lower(word)
+        """Split a single lowercase word into syllables (internal)."""
         syllables = []
         start = 0
 
-        for i in range(1, len(word)):
-            if word[i] in VOWELS_NORMAL:
-                if word[i - 1] not in CONSONANTS:
-                    continue
-                if start == 0 and i == 1:
-                    continue
-                syllables.append(word[start : i - 1])
-                start = i - 1
-            elif word[i] in VOWELS_YA:
-                if word[i - 1] in SIGNS or word[i - 1] in VOWELS_NORMAL:
-                    syllables.append(word[start:i])
-                    start = i
-                    continue
-                if word[i - 1] in CONSONANTS:
-                    if start == 0 and i == 1:
-                        continue
-                    syllables.append(word[start : i - 1])
-                    start = i - 1
+        # A syllable starts at a consonant before a vowel (or я/е/ё/ю), except at the
+        # start of the word, and at я/е/ё/ю after a vowel or sign
+        for match in _SYLLABLE_START_RE.finditer(word.translate(_CHAR_CLASSES)):
+            syllables.append(word[start : match.start()])
+            start = match.start()
 
         syllables.append(word[start:])
         return syllables
@@ -236,10 +590,28 @@ _default_g2p: G2P | None = None
 def _get_g2p() -> G2P:
     global _default_g2p
     if _default_g2p is None:
-        _default_g2p = G2P()
+        _default_g2p = G2P(cache_size=DEFAULT_CACHE_SIZE)
     return _default_g2p
 
 
+_worker_g2p: G2P | None = None
+
+
+def _init_worker(cache_size: int, lexicon_path: Path | None) -> None:
+    global _worker_g2p
+    # Each worker maps the same lexicon file, so its pages are shared between processes
+    _worker_g2p = G2P(cache_size=cache_size, lexicon=lexicon_path)
+
+
+def _convert_chunk_in_worker(texts: list[str]) -> list[str]:
+    return (_worker_g2p or _get_g2p())._convert_chunk(texts)
+
+
+def convert_ids(text: str) -> PhonemeIds:
+    """Convert Mongolian text to phoneme IDs with boundary markers."""
+    return _get_g2p().convert_ids(text)
+
+
 def convert(text: str) -> str:
     """Convert Mongolian text to phoneme representation."""
     return _get_g2p().convert(text)
@@ -248,3 +620,31 @@ def convert(text: str) -> str:
 def syllabify(word: str) -> list[str]:
     """Split Mongolian word into syllables."""
     return _get_g2p().syllabify(word)
+
+
+def convert_many(
+    texts: Iterable[str], workers: int | None = 1, chunksize: int = 1000
+) -> Iterator[str]:
+    """Convert many Mongolian texts to phoneme representations, in input order."""
+    return _get_g2p().convert_many(texts, workers=workers, chunksize=chunksize)
+
+
+def cache_info() -> dict[str, int]:
+    """Word cache counters of the default converter used by convert()."""
+    converter = _get_g2p()
+    return {
+        "hits": converter.cache_hits,
+        "misses": converter.cache_misses,
+        "evictions": converter.cache_evictions,
+        "size": converter.cache_size,
+    }
+
+
+def clear_cache() -> None:
+    """Drop the word cache of the default converter used by convert()."""
+    _get_g2p().clear_cache()
+
+
+def set_cache_size(cache_size: int) -> None:
+    """Resize the word cache of the default converter used by convert(); 0 disables it."""
+    _get_g2p().set_cache_size(cache_size)
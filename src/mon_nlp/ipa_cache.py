@@ -0,0 +1,159 @@
+"""Persistent word to IPA cache for transliteration.
+
+Phonemizing with espeak is the slowest step of transliteration, while the
+English words it sees repeat across runs and processes. IPACache stores the
+IPA of each (language, word) pair in an SQLite file, so EnglishToCyrillic only
+sends words it has not seen before to phonemizer.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ipa (
+    language TEXT NOT NULL,
+    word TEXT NOT NULL,
+    ipa TEXT NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (language, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ipa_used ON ipa (used);
+"""
+# Stay well below SQLite's limit on bound parameters per statement
+_BATCH = 500
+
+
+class IPACache:
+    """SQLite-backed word to IPA cache, safe to share between threads and processes.
+
+    Args:
+        path: Database file, created if it does not exist
+        max_entries: Keep at most this many entries, dropping the least recently
+            used ones first; None for no limit
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_entries: int | None = None):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be positive or None, got {max_entries}")
+        self._path = Path(path)
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """File the cache is stored in."""
+        return self._path
+
+    @property
+    def max_entries(self) -> int | None:
+        """Maximum number of entries kept, or None for no limit."""
+        return self._max_entries
+
+    @property
+    def hits(self) -> int:
+        """Number of words found by get_many since the cache was opened."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of words get_many did not find since the cache was opened."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of looked-up words that were found (0.0 before any lookup)."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def _tick(self) -> int:
+        # Wall-clock use time, so processes sharing the file agree on recency;
+        # kept strictly increasing within a process for coarse clocks
+        self._clock = max(time.time_ns(), self._clock + 1)
+        return self._clock
+
+    def get_many(self, language: str, words: Iterable[str]) -> dict[str, str]:
+        """Look up words, marking the ones found as recently used.
+
+        Args:
+            language: Language code the IPA was produced for
+            words: Normalized words
+
+        Returns:
+            IPA for each word in the cache; missing words are left out
+        """
+        words = list(dict.fromkeys(words))
+        found: dict[str, str] = {}
+        with self._lock, self._conn:
+            now = self._tick()
+            for start in range(0, len(words), _BATCH):
+                batch = words[start : start + _BATCH]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT word, ipa FROM ipa WHERE language = ? AND word IN ({marks})",
+                    (language, *batch),
+                )
+                found.update(rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE ipa SET used = ? WHERE language = ? AND word = ?",
+                    [(now, language, word) for word in found],
+                )
+            self._hits += len(found)
+            self._misses += len(words) - len(found)
+        return found
+
+    def put_many(self, language: str, entries: Mapping[str, str]) -> None:
+        """Store word to IPA entries, then trim the cache to max_entries.
+
+        Args:
+            language: Language code the IPA was produced for
+            entries: Normalized word to IPA mapping
+        """
+        if not entries:
+            return
+        with self._lock, self._conn:
+            now = self._tick()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ipa (language, word, ipa, used) VALUES (?, ?, ?, ?)",
+                [(language, word, ipa, now) for word, ipa in entries.items()],
+            )
+            if self._max_entries is not None:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM ipa").fetchone()
+                if count > self._max_entries:
+                    self._conn.execute(
+                        "DELETE FROM ipa WHERE (language, word) IN "
+                        "(SELECT language, word FROM ipa ORDER BY used LIMIT ?)",
+                        (count - self._max_entries,),
+                    )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM ipa").fetchone()
+        return count
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counts."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM ipa")
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "IPACache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,180 @@
+"""Precompiled binary pronunciation lexicon for G2P.
+
+A lexicon file maps cleaned words to the phoneme strings G2P.convert would
+produce (or to overrides, e.g. for loanwords). It is written once with
+build_lexicon and opened with Lexicon, which memory-maps the file so every
+process reading the same lexicon shares one copy in the page cache.
+
+File layout (little-endian):
+    magic b"MNLX", version u32, entry count n u32
+    key offsets u32[n + 1], value offsets u32[n + 1]
+    key bytes (UTF-8, sorted), value bytes (UTF-8)
+"""
+
+import array
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mon_nlp.g2p import G2P
+
+MAGIC = b"MNLX"
+VERSION = 1
+_HEADER = struct.Struct("<4sII")
+# Offset tables can be read in place when native "I" is a little-endian u32
+_NATIVE_U32 = sys.byteorder == "little" and struct.calcsize("I") == 4
+
+
+def build_lexicon(
+    words: Iterable[str],
+    path: str | os.PathLike[str],
+    overrides: Mapping[str, str] | None = None,
+    converter: "G2P | None" = None,
+) -> int:
+    """Convert a word list with G2P once and write it as a binary lexicon.
+
+    Words are cleaned the way G2P.convert cleans them (lowercase, Mongolian
+    letters only, split on whitespace); words that clean to nothing are skipped.
+
+    Args:
+        words: Words to precompute
+        path: Output file
+        overrides: Word to phoneme string entries that replace the rule output
+            (and are added if the word is not in words)
+        converter: G2P instance to run; a plain G2P() by default
+
+    Returns:
+        Number of entries written
+
+    Raises:
+        ValueError: If an override key does not clean to exactly one word (e.g.
+            Latin "Google" or "Нью Йорк"), or its phonemes are not in
+            PHONEME_INVENTORY
+    """
+    from mon_nlp.g2p import _CLEAN_TABLE, G2P, _phoneme_string_ids
+
+    if converter is None:
+        converter = G2P()
+
+    entries: dict[bytes, bytes] = {}
+    for word in words:
+        for cleaned in word.translate(_CLEAN_TABLE).split():
+            if cleaned.encode() not in entries:
+                entries[cleaned.encode()] = converter.convert(cleaned).encode()
+    for word, phonemes in (overrides or {}).items():
+        # G2P looks up single cleaned words, so anything else could never be used
+        cleaned = word.translate(_CLEAN_TABLE).split()
+        if len(cleaned) != 1:
+            raise ValueError(
+                f"Override {word!r} is not a single Mongolian Cyrillic word; "
+                "G2P looks up one cleaned word at a time"
+            )
+        _phoneme_string_ids(phonemes)
+        entries[cleaned[0].encode()] = phonemes.encode()
+
+    keys = sorted(entries)
+    key_offsets = [0]
+    value_offsets = [0]
+    for key in keys:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(entries[key]))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(keys)))
+        f.write(struct.pack(f"<{len(keys) + 1}I", *key_offsets))
+        f.write(struct.pack(f"<{len(keys) + 1}I", *value_offsets))
+        f.write(b"".join(keys))
+        f.write(b"".join(entries[key] for key in keys))
+    return len(keys)
+
+
+class Lexicon:
+    """Read-only, memory-mapped view of a lexicon written by build_lexicon.
+
+    Lookups binary-search the sorted keys in place; only the compared key and
+    the returned value are copied out of the mapping.
+
+    Args:
+        path: Lexicon file
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._path = Path(path)
+        invalid = ValueError(f"Not a mon-nlp lexicon (version {VERSION}): {self._path}")
+        with open(self._path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise invalid
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._mmap)
+        start = _HEADER.size
+        table_size = 4 * (count + 1)
+        if magic != MAGIC or version != VERSION or len(self._mmap) < start + 2 * table_size:
+            self._mmap.close()
+            raise invalid
+        self._count = count
+        self._key_offsets = self._offsets(start)
+        self._value_offsets = self._offsets(start + table_size)
+        self._keys_start = start + 2 * table_size
+        self._values_start = self._keys_start + self._key_offsets[count]
+        if self._values_start + self._value_offsets[count] > len(self._mmap):
+            self.close()
+            raise invalid
+
+    def _offsets(self, start: int) -> memoryview:
+        """The little-endian u32 offset table at start (internal).
+
+        A zero-copy view of the mapping where native "I" matches the file;
+        otherwise the table is unpacked into memory.
+        """
+        if _NATIVE_U32:
+            return memoryview(self._mmap)[start : start + 4 * (self._count + 1)].cast("I")
+        offsets = struct.unpack_from(f"<{self._count + 1}I", self._mmap, start)
+        return memoryview(array.array("Q", offsets))
+
+    @property
+    def path(self) -> Path:
+        """File the lexicon was opened from."""
+        return self._path
+
+    def get(self, word: str) -> str | None:
+        """Phonemes for a cleaned word, or None if the word is not in the lexicon."""
+        key = word.encode()
+        data = self._mmap
+        key_offsets = self._key_offsets
+        base = self._keys_start
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            candidate = data[base + key_offsets[mid] : base + key_offsets[mid + 1]]
+            if candidate < key:
+                low = mid + 1
+            elif candidate > key:
+                high = mid
+            else:
+                base = self._values_start
+                value = data[base + self._value_offsets[mid] : base + self._value_offsets[mid + 1]]
+                return value.decode()
+        return None
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.get(word) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        self._key_offsets.release()
+        self._value_offsets.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "Lexicon":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
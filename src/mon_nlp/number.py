@@ -1,5 +1,11 @@
 """Number to Mongolian words conversion."""
 
+import numbers
+import re
+import sys
+from collections.abc import Iterable, Sequence
+from decimal import Decimal, InvalidOperation
+
 NUMBER_NAMES = {
     0: ("тэг", "тэг"),
     1: ("нэг", "нэгэн"),
@@ -42,6 +48,8 @@ FRACTION_NAMES = {
     1_000_000_000_000: "их наядны",
 }
 
+_FRACTION_NAMES_BY_DIGITS = {len(str(den)) - 1: name for den, name in FRACTION_NAMES.items()}
+
 ROMAN_NUMERALS = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
 
 
@@ -67,8 +75,12 @@ def roman2num(roman: str) -> int:
     return total
 
 
-def _num2words_3digits(number: int, cont: bool = False, include_leading_one: bool = True) -> str:
-    """Convert 3-digit number (0-999) to Mongolian words."""
+SCALE_NAMES = tuple(NUMBER_NAMES[1000**i][0] if i else "" for i in range(5))
+
+_CHUNK_WORDS: dict[tuple[bool, bool], tuple[str, ...]] = {}
+
+
+def _build_3digits(number: int, cont: bool, include_leading_one: bool) -> str:
     if number == 0:
         return NUMBER_NAMES[0][0]
 
@@ -91,6 +103,127 @@ def _num2words_3digits(number: int, cont: bool = False, include_leading_one: boo
     return " ".join(reversed(parts))
 
 
+def _chunk_words(cont: bool, include_leading_one: bool) -> tuple[str, ...]:
+    """Words for every 3-digit chunk 0-999, built once per form."""
+    key = (cont, include_leading_one)
+    table = _CHUNK_WORDS.get(key)
+    if table is None:
+        table = tuple(_build_3digits(n, cont, include_leading_one) for n in range(1000))
+        _CHUNK_WORDS[key] = table
+    return table
+
+
+def _num2words_3digits(number: int, cont: bool = False, include_leading_one: bool = True) -> str:
+    """Convert 3-digit number (0-999) to Mongolian words."""
+    return _chunk_words(cont, include_leading_one)[number]
+
+
+def _chunks2words(chunks: Sequence[int], include_leading_one: bool) -> str:
+    """Join 3-digit chunks, least significant first, with scale words (internal).
+
+    Same joining rules as the chunk loop in _num2words, for chunks that were
+    already split off (e.g. by vectorized divmod).
+    """
+    plain = _chunk_words(False, include_leading_one)
+    cont = _chunk_words(True, include_leading_one)
+    parts: list[str] = []
+    for scale, chunk in enumerate(chunks):
+        if chunk > 0:
+            if scale:
+                parts.append(SCALE_NAMES[scale])
+            if chunk > 1 or include_leading_one:
+                parts.append(cont[chunk] if parts and chunk > 1 else plain[chunk])
+    return " ".join(reversed(parts))
+
+
+def _grouped_words(digits: str, by_n_digits: int, include_leading_one: bool) -> str:
+    """Read a digit string in groups of by_n_digits from the right (internal).
+
+    Works on the decimal string directly, so it runs in linear time and keeps
+    leading zeros of string input ("0099" by 2 -> "тэг, тэг, ерэн ес").
+    """
+    zero = NUMBER_NAMES[0][0]
+    parts = []
+    start = len(digits) % by_n_digits or by_n_digits
+    group = digits[:start]
+    while group:
+        value = int(group)
+        if value:
+            parts.append(_num2words(value, include_leading_one=include_leading_one))
+        else:
+            parts.append(", ".join([zero] * len(group)))
+        group = digits[start : start + by_n_digits]
+        start += by_n_digits
+    return ", ".join(parts)
+
+
+# Stay below CPython's default 4300-digit limit on int to str conversion (~3900 digits)
+_STR_BITS = 13_000
+
+
+def _int_digits(number: int) -> str:
+    """Decimal digits of a non-negative int, also past the int/str conversion limit."""
+    if number.bit_length() <= _STR_BITS:
+        return str(number)
+    # Split on a power of 10 into two halves of about the same number of digits
+    half = number.bit_length() * 30103 // 200000
+    high, low = divmod(number, 10**half)
+    return _int_digits(high) + _int_digits(low).zfill(half)
+
+
+def _digits2words(digits: str, by_n_digits: int, include_leading_one: bool) -> str:
+    """Convert a non-negative decimal digit string to Mongolian words (internal)."""
+    if by_n_digits == 0:
+        digits = digits.lstrip("0")
+        if len(digits) < 15 or (len(digits) == 15 and digits <= "999000000000000"):
+            return _num2words(int(digits or "0"), include_leading_one=include_leading_one)
+        by_n_digits = 3
+    return _grouped_words(digits or "0", by_n_digits, include_leading_one)
+
+
+def _split_str(number: str) -> tuple[bool, str, str]:
+    """Split a numeric string into (negative, integer digits, fraction digits)."""
+    text = number.strip()
+    negative = text.startswith("-")
+    if text[:1] in "+-":
+        text = text[1:]
+    int_digits, _, frac_digits = text.replace(",", ".").partition(".")
+    digits = int_digits + frac_digits
+    if not digits.isdecimal() or not digits.isascii():
+        raise ValueError(f"Invalid number: {number!r}")
+    return negative, int_digits, frac_digits
+
+
+def _split_decimal(number: Decimal) -> tuple[bool, str, str]:
+    """Split a Decimal into (negative, integer digits, fraction digits)."""
+    if not number.is_finite():
+        raise ValueError(f"Cannot convert non-finite number: {number}")
+    sign, digit_tuple, exponent = number.as_tuple()
+    assert isinstance(exponent, int)
+    digits = "".join(map(str, digit_tuple))
+    if exponent >= 0:
+        return bool(sign), digits + "0" * exponent, ""
+    point = len(digits) + exponent
+    if point <= 0:
+        return bool(sign), "", "0" * -point + digits
+    return bool(sign), digits[:point], digits[point:]
+
+
+def _real_to_decimal(number: object) -> Decimal:
+    """Exact digits of a float or other real number, e.g. a NumPy float (internal)."""
+    if isinstance(number, float):
+        # repr gives the shortest round-trip digits: 3.14, not 3.140000000000000124.
+        # float() first, since NumPy 2's float64 repr is "np.float64(3.14)".
+        return Decimal(repr(float(number)))
+    if not isinstance(number, numbers.Real):
+        raise ValueError(f"Cannot convert {type(number).__name__} to words: {number!r}")
+    try:
+        # NumPy floats print the shortest digits for their own precision (float32 0.1)
+        return Decimal(str(number))
+    except InvalidOperation:
+        return Decimal(repr(float(number)))
+
+
 def _num2words(
     number: int,
     by_n_digits: int = 0,
@@ -109,40 +242,23 @@ def _num2words(
         by_n_digits = 3
 
     if by_n_digits > 0:
-        while remaining > 0:
-            chunk = remaining % (10**by_n_digits)
-            remaining = remaining // (10**by_n_digits)
-
-            if chunk > 0:
-                parts.append(_num2words(chunk, include_leading_one=include_leading_one))
-            else:
-                parts.append(", ".join([NUMBER_NAMES[0][0]] * by_n_digits))
-
-        text = ", ".join(reversed(parts))
+        text = _grouped_words(_int_digits(remaining), by_n_digits, include_leading_one)
+    elif remaining < 1000:
+        text = _chunk_words(False, include_leading_one)[remaining]
+        if remaining == 1 and not include_leading_one:
+            text = ""
     else:
-        current_unit = 1
+        plain = _chunk_words(False, include_leading_one)
+        cont = _chunk_words(True, include_leading_one)
+        scale = 0
         while remaining > 0:
-            chunk = remaining % 1000
-            remaining = remaining // 1000
-
+            remaining, chunk = divmod(remaining, 1000)
             if chunk > 0:
-                if current_unit != 1:
-                    if current_unit not in NUMBER_NAMES:
-                        return _num2words(
-                            abs(number) if not negative else -abs(number),
-                            by_n_digits=3,
-                            include_leading_one=include_leading_one,
-                        )
-                    parts.append(NUMBER_NAMES[current_unit][0])
+                if scale:
+                    parts.append(SCALE_NAMES[scale])
                 if chunk > 1 or include_leading_one:
-                    parts.append(
-                        _num2words_3digits(
-                            chunk,
-                            cont=(len(parts) > 0 and chunk > 1),
-                            include_leading_one=include_leading_one,
-                        )
-                    )
-            current_unit *= 1000
+                    parts.append(cont[chunk] if parts and chunk > 1 else plain[chunk])
+            scale += 1
         text = " ".join(reversed(parts))
 
     if negative:
@@ -152,7 +268,7 @@ def _num2words(
 
 
 def num2words(
-    number: int | float,
+    number: int | float | Decimal | str,
     by_n_digits: int = 0,
     use_dot: bool = False,
     include_leading_one: bool = True,
@@ -160,7 +276,8 @@ def num2words(
     """Convert number to Mongolian words.
 
     Args:
-        number: Number to convert (int or float)
+        number: Number to convert (int, float, Decimal or numeric string such as "3,14");
+            other integral and real types, e.g. NumPy scalars, are accepted too
         by_n_digits: If > 0, converts digit-by-digit in groups
         use_dot: Use "цэг" for decimal point instead of fraction names
         include_leading_one: Include "нэг" for units like 1000
@@ -176,37 +293,512 @@ def num2words(
         >>> num2words(3.14, use_dot=True)
         'гурав цэг арван дөрөв'
     """
-    if isinstance(number, int):
+    # Exact type checks first: the numbers ABCs cost more than an int lookup
+    number_type = type(number)
+    if number_type is int:
         return _num2words(number, by_n_digits=by_n_digits, include_leading_one=include_leading_one)
-
-    # Convert to string avoiding scientific notation
-    abs_num = abs(number)
-    num_str = f"{abs_num:.15f}".rstrip("0").rstrip(".")
-
-    if "." in num_str:
-        int_str, frac_str = num_str.split(".")
+    if number_type is str:
+        negative, int_digits, frac_digits = _split_str(number)
+    elif number_type is Decimal:
+        negative, int_digits, frac_digits = _split_decimal(number)
+    elif isinstance(number, numbers.Integral):
+        # int() also takes bool and NumPy integers
+        return _num2words(
+            int(number), by_n_digits=by_n_digits, include_leading_one=include_leading_one
+        )
+    elif isinstance(number, str):
+        negative, int_digits, frac_digits = _split_str(number)
     else:
-        int_str, frac_str = num_str, ""
-
-    int_part = int(int_str)
-    frac_part_int = int(frac_str) if frac_str else 0
+        if not isinstance(number, Decimal):
+            number = _real_to_decimal(number)
+        negative, int_digits, frac_digits = _split_decimal(number)
 
-    text = _num2words(int_part, by_n_digits=by_n_digits, include_leading_one=include_leading_one)
+    frac_digits = frac_digits.rstrip("0")
+    text = _digits2words(int_digits, by_n_digits, include_leading_one)
 
-    if number < 0:
+    if negative and (frac_digits or int_digits.strip("0")):
         text = "хасах " + text
 
-    if frac_part_int == 0:
+    if not frac_digits:
         return text
 
-    frac_text = _num2words(frac_part_int, include_leading_one=include_leading_one)
+    frac_text = _digits2words(frac_digits, 0, include_leading_one)
 
     if use_dot or by_n_digits > 0:
         return f"{text} цэг {frac_text}"
 
-    frac_denominator = 10 ** len(frac_str)
-    frac_den_text = FRACTION_NAMES.get(frac_denominator, "")
+    frac_den_text = _FRACTION_NAMES_BY_DIGITS.get(len(frac_digits), "")
 
     if frac_den_text:
         return f"{text} {frac_den_text} {frac_text}"
     return f"{text} цэг {frac_text}"
+
+
+def num2words_batch(
+    numbers: Iterable[int | float | Decimal | str],
+    by_n_digits: int = 0,
+    use_dot: bool = False,
+    include_leading_one: bool = True,
+) -> list[str]:
+    """Convert many numbers to Mongolian words.
+
+    Repeated values are converted once. A NumPy integer array is split into
+    3-digit chunks with vectorized divmod; NumPy itself is optional and any
+    other input, including float arrays and NumPy scalars, goes through
+    num2words per distinct value.
+
+    Args:
+        numbers: List, iterable or NumPy integer array of numbers
+        by_n_digits: If > 0, converts digit-by-digit in groups
+        use_dot: Use "цэг" for decimal point instead of fraction names
+        include_leading_one: Include "нэг" for units like 1000
+
+    Returns:
+        Mongolian words for each number, in input order
+    """
+    np = sys.modules.get("numpy")
+    if (
+        np is not None
+        and isinstance(numbers, np.ndarray)
+        and numbers.dtype.kind in "iu"
+        and by_n_digits == 0
+    ):
+        return _num2words_array(np, numbers, include_leading_one)
+    if np is not None and isinstance(numbers, np.ndarray):
+        # Flattened like the fast path. tolist() gives plain Python numbers, but
+        # float32/float16 keep their scalars: as Python floats they would gain
+        # binary digits (0.1 -> 0.10000000149011612)
+        if numbers.dtype.kind == "f" and numbers.dtype.itemsize < 8:
+            numbers = list(numbers.ravel())
+        else:
+            numbers = numbers.ravel().tolist()
+
+    cache: dict[tuple[type, object], str] = {}
+    results = []
+    for number in numbers:
+        key = (type(number), number)
+        text = cache.get(key)
+        if text is None:
+            text = num2words(
+                number,
+                by_n_digits=by_n_digits,
+                use_dot=use_dot,
+                include_leading_one=include_leading_one,
+            )
+            cache[key] = text
+        results.append(text)
+    return results
+
+
+def _num2words_array(np, numbers, include_leading_one: bool) -> list[str]:
+    """Vectorized num2words_batch for NumPy integer arrays (internal)."""
+    values, inverse = np.unique(numbers.ravel(), return_inverse=True)
+    words = [""] * len(values)
+
+    limit = 999 * 1_000_000_000_000
+    in_range = (values >= -limit) if values.dtype.kind == "i" else np.ones(len(values), bool)
+    in_range &= values <= limit
+    for index in np.flatnonzero(~in_range).tolist():
+        words[index] = _num2words(int(values[index]), include_leading_one=include_leading_one)
+
+    indices = np.flatnonzero(in_range)
+    signed = values[indices].astype(np.int64)
+    remaining = np.abs(signed)
+    chunks = np.empty((len(SCALE_NAMES), len(indices)), dtype=np.int64)
+    for scale in range(len(SCALE_NAMES)):
+        remaining, chunks[scale] = np.divmod(remaining, 1000)
+
+    zero = NUMBER_NAMES[0][0]
+    for index, value, value_chunks in zip(
+        indices.tolist(), signed.tolist(), chunks.T.tolist(), strict=True
+    ):
+        if value == 0:
+            words[index] = zero
+            continue
+        text = _chunks2words(value_chunks, include_leading_one)
+        words[index] = "хасах " + text if value < 0 else text
+
+    return [words[i] for i in inverse.ravel().tolist()]
+
+
+# Comma-separated 3-digit groups are thousands ("10,000"), and so are two or more
+# dot-separated ones ("1.000.000"); any other comma or dot is a decimal separator
+# ("3,5"). A number followed by another separator and digit ("3.5.2024", "1.2.3")
+# is a date or version, so each part is read as a separate integer.
+_COMMA_GROUPED_TEXT = r"[0-9]{1,3}(?:,[0-9]{3})+(?:\.[0-9]+)?"
+_DOT_GROUPED_TEXT = r"[0-9]{1,3}(?:\.[0-9]{3}){2,}(?:,[0-9]+)?"
+_NUMBER_TEXT = (
+    rf"(?<![0-9][.,])(?:{_COMMA_GROUPED_TEXT}|{_DOT_GROUPED_TEXT}|[0-9]+[.,][0-9]+)"
+    rf"(?![.,]?[0-9])|[0-9]+"
+)
+_COMMA_GROUPED_RE = re.compile(_COMMA_GROUPED_TEXT)
+_DOT_GROUPED_RE = re.compile(_DOT_GROUPED_TEXT)
+_ROMAN_TEXT = r"M{0,3}(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{0,3})"
+# A one-letter numeral ("C", "I", "V") only counts before one of these words
+_ROMAN_CONTEXT_WORDS = [
+    "зуун",
+    "зууны",
+    "зуунд",
+    "зуунаас",
+    "он",
+    "оны",
+    "онд",
+    "оноос",
+    "бүлэг",
+    "бүлгийн",
+    "бүлэгт",
+]
+
+# One scan finds every form: a range or a single (optionally negative) number with an
+# optional percent sign, or an uppercase Roman numeral standing as a whole word. A minus
+# sign only counts when it does not follow a word character ("COVID-19" keeps its hyphen).
+# A range hyphen must touch both numbers ("5 - 3" is not a range); en and em dashes
+# may have spaces around them.
+_TEXT_NUMBER_RE = re.compile(
+    rf"(?P<neg>(?<![\w.,])-)?(?P<start>{_NUMBER_TEXT})"
+    rf"(?:(?:(?P<hyphen>-)|\s*(?P<dash>[\u2013\u2014])\s*)(?P<end>{_NUMBER_TEXT}))?"
+    rf"(?P<percent>\s*%)?"
+    rf"|\b(?=[MDCLXVI]{{2,}}\b|[MDCLXVI]\s+(?:{'|'.join(_ROMAN_CONTEXT_WORDS)})\b)"
+    rf"(?P<roman>{_ROMAN_TEXT})\b"
+)
+_DIGIT_RE = re.compile(r"[0-9]")
+_DIGIT_OR_ROMAN_RE = re.compile(r"[0-9MDCLXVI]")
+_ATTRIBUTIVE_NAMES = {plain: cont for plain, cont in NUMBER_NAMES.values()}
+
+
+def _attributive(words: str) -> str:
+    """Put the last number word into the form used before a noun (internal)."""
+    head, sep, last = words.rpartition(" ")
+    return head + sep + _ATTRIBUTIVE_NAMES.get(last, last)
+
+
+def _text_number_words(number: str, use_dot: bool) -> str:
+    """num2words for a number matched in running text (internal)."""
+    if _COMMA_GROUPED_RE.fullmatch(number):
+        number = number.replace(",", "")
+    elif _DOT_GROUPED_RE.fullmatch(number):
+        number = number.replace(".", "")
+    return num2words(number, use_dot=use_dot)
+
+
+def verbalize_text(text: str, use_dot: bool = False, roman: bool = False) -> str:
+    """Replace numbers inside running text with Mongolian words.
+
+    Handles integers, thousands groups ("10,000", "1.000.000"), decimals with
+    "." or ",", negative numbers, percentages and ranges such as "5-10" (the
+    dash is kept). Dates and versions ("3.5.2024", "1.2.3") are read one
+    number at a time. If roman is True, uppercase Roman numerals of two or
+    more letters are converted too, and one-letter ones before a word such as
+    "зуун" or "он" ("V зуун"). Text without digits (or Roman numeral letters)
+    is returned as is without running the full pattern.
+
+    Args:
+        text: Text containing numbers
+        use_dot: Use "цэг" for decimal point instead of fraction names
+        roman: Also convert Roman numerals such as "XXI"; off by default, since
+            Latin words and sizes ("Vitamin C", "XL") look the same
+
+    Returns:
+        Text with every number replaced by its Mongolian words
+
+    Examples:
+        >>> verbalize_text("Үнэ 25% буурч 3,5 сая болсон")
+        'Үнэ хорин таван хувь буурч гурав аравны тав сая болсон'
+    """
+    if (_DIGIT_OR_ROMAN_RE if roman else _DIGIT_RE).search(text) is None:
+        return text
+
+    def replace(match: re.Match[str]) -> str:
+        roman_text = match["roman"]
+        if roman_text is not None:
+            # Empty when a Roman-letter word is not a valid numeral ("IIII", "VX")
+            return _num2words(roman2num(roman_text)) if roman and roman_text else roman_text
+        words = _text_number_words(match["start"], use_dot)
+        if match["neg"]:
+            words = "хасах " + words
+        end = match["end"]
+        if end is not None:
+            dash = match["hyphen"] or match["dash"]
+            end_words = _text_number_words(end, use_dot)
+            if match["percent"]:
+                return f"{words}{dash}{_attributive(end_words)} хувь"
+            return f"{words}{dash}{end_words}"
+        if match["percent"]:
+            return _attributive(words) + " хувь"
+        return words
+
+    return _TEXT_NUMBER_RE.sub(replace, text)
+
+
+_ZERO, _UNIT, _TEN, _HUNDRED, _SCALE, _FRACTION, _MINUS, _POINT, _PREFIX = range(9)
+
+_WordEntry = tuple[int, int, dict[str, tuple[int, int]] | None]
+
+
+def _build_word_table() -> dict[str, _WordEntry]:
+    """Number words as word -> (kind, value, two-word entries it starts).
+
+    Every entry is one or two words ("их наяд", "арван мянганы"). A word that
+    only starts a two-word entry ("их") has kind _PREFIX.
+    """
+    entries: dict[str, tuple[int, int]] = {"хасах": (_MINUS, 0), "цэг": (_POINT, 0)}
+    for value, forms in NUMBER_NAMES.items():
+        if value == 0:
+            kind = _ZERO
+        elif value < 10:
+            kind = _UNIT
+        elif value < 100:
+            kind = _TEN
+        elif value == 100:
+            kind = _HUNDRED
+        else:
+            kind = _SCALE
+        for form in forms:
+            entries[form] = (kind, value)
+    for den, name in FRACTION_NAMES.items():
+        entries[name] = (_FRACTION, len(str(den)) - 1)
+
+    singles: dict[str, tuple[int, int]] = {}
+    pairs: dict[str, dict[str, tuple[int, int]]] = {}
+    for words, lexeme in entries.items():
+        first, _, second = words.partition(" ")
+        if second:
+            pairs.setdefault(first, {})[second] = lexeme
+        else:
+            singles[first] = lexeme
+    return {
+        word: (*singles.get(word, (_PREFIX, 0)), pairs.get(word))
+        for word in singles.keys() | pairs.keys()
+    }
+
+
+# One lookup per word; only a word that starts a two-word entry looks at the next one
+_WORD_TABLE = _build_word_table()
+_WORD_RE = re.compile(r"\w+")
+
+
+def _match_word(words: Sequence[str], i: int) -> tuple[int, int, int] | None:
+    """Longest number word at words[i], as (kind, value, index after it) (internal)."""
+    entry = _WORD_TABLE.get(words[i])
+    if entry is None:
+        return None
+    kind, value, pairs = entry
+    if pairs is not None and i + 1 < len(words):
+        pair = pairs.get(words[i + 1])
+        if pair is not None:
+            return pair[0], pair[1], i + 2
+    return None if kind == _PREFIX else (kind, value, i + 1)
+
+
+def _parse_integer(words: Sequence[str], i: int) -> tuple[int, int] | None:
+    """Read one integer left to right from words[i], as (value, index after it).
+
+    Follows the num2words layout: per chunk an optional hundreds digit and "зуу",
+    then tens, then units, closed by a scale word smaller than the previous one.
+    A bare scale word counts as one of it ("мянга" = 1000). Returns None if no
+    number word starts at i (internal).
+    """
+    total = 0
+    chunk = 0
+    last_scale = 0
+    last_kind = -1
+    n_words = len(words)
+    start = i
+    while i < n_words:
+        entry = _WORD_TABLE.get(words[i])
+        if entry is None:
+            break
+        kind, value, pairs = entry
+        next_i = i + 1
+        if pairs is not None and next_i < n_words:
+            pair = pairs.get(words[next_i])
+            if pair is not None:
+                kind, value = pair
+                next_i += 1
+        if kind == _UNIT:
+            if chunk % 10 or last_kind == _UNIT:
+                break
+            chunk += value
+        elif kind == _TEN:
+            if chunk % 100:
+                break
+            chunk += value
+        elif kind == _HUNDRED:
+            if chunk >= 10 or (chunk == 0 and last_kind == _UNIT):
+                break
+            chunk = (chunk or 1) * 100
+        elif kind == _SCALE:
+            if last_scale and value >= last_scale:
+                break
+            total += (chunk or 1) * value
+            chunk = 0
+            last_scale = value
+        elif kind == _ZERO and i == start:
+            return 0, next_i
+        else:
+            break
+        last_kind = kind
+        i = next_i
+    if i == start:
+        return None
+    return total + chunk, i
+
+
+def _parse_number(words: Sequence[str], i: int) -> tuple[int | Decimal, int] | None:
+    """Read one number with optional sign and fraction from words[i] (internal)."""
+    negative = i < len(words) and words[i] == "хасах"
+    integer = _parse_integer(words, i + negative)
+    if integer is None:
+        return None
+    int_value, end = integer
+
+    value: int | Decimal = int_value
+    found = _match_word(words, end) if end < len(words) else None
+    if found is not None and found[0] in (_FRACTION, _POINT):
+        kind, n_digits, frac_start = found
+        fraction = _parse_integer(words, frac_start)
+        if fraction is not None and fraction[0] > 0:
+            frac_value, frac_end = fraction
+            frac_digits = str(frac_value)
+            if kind == _FRACTION:
+                frac_digits = frac_digits.zfill(n_digits)
+            if kind == _POINT or len(frac_digits) == n_digits:
+                value = Decimal(f"{int_value}.{frac_digits}")
+                end = frac_end
+
+    if negative:
+        value = -value
+    return value, end
+
+
+# Scale words from largest to smallest, for the fast path of words2num
+_SCALES_DESCENDING = [(SCALE_NAMES[i], 1000**i) for i in range(len(SCALE_NAMES) - 1, 0, -1)]
+_CHUNK_VALUES: dict[str, int] = {}
+
+
+def _chunk_values() -> dict[str, int]:
+    """Value of every nonzero 3-digit chunk in each form num2words writes, built once."""
+    if not _CHUNK_VALUES:
+        for cont in (False, True):
+            for include_leading_one in (False, True):
+                for value, words in enumerate(_chunk_words(cont, include_leading_one)):
+                    if value:
+                        _CHUNK_VALUES.setdefault(words, value)
+    return _CHUNK_VALUES
+
+
+def _words2int(text: str) -> int | None:
+    """Read an integer written exactly as num2words writes it, one scale at a time.
+
+    Partitions the lowercased text on each scale word and looks each chunk up
+    whole, instead of walking it word by word. Returns None for anything else
+    (zero, fractions, extra spaces, scales out of order), which _parse_number
+    then reads or rejects (internal).
+    """
+    negative = text.startswith("хасах ")
+    if negative:
+        text = text[6:]
+    if not text:
+        return None
+    chunk_values = _chunk_values()
+    total = 0
+    for name, scale in _SCALES_DESCENDING:
+        head, sep, tail = text.partition(name)
+        if not sep:
+            continue
+        # The scale word must stand alone ("мянга", not "мянганы")
+        if tail:
+            if tail[0] != " ":
+                return None
+            tail = tail[1:]
+        if head:
+            if head[-1] != " ":
+                return None
+            chunk = chunk_values.get(head[:-1])
+            if chunk is None:
+                return None
+        else:
+            chunk = 1
+        total += chunk * scale
+        text = tail
+    if text:
+        chunk = chunk_values.get(text)
+        if chunk is None:
+            return None
+        total += chunk
+    return -total if negative else total
+
+
+def words2num(text: str) -> int | Decimal:
+    """Convert Mongolian number words back to a number.
+
+    Inverse of num2words for by_n_digits=0: reads both word forms ("тав" and
+    "таван"), a leading "хасах", fraction names ("зууны") and "цэг".
+
+    Args:
+        text: Mongolian words of a single number
+
+    Returns:
+        int for whole numbers, Decimal when the words contain a fraction
+
+    Raises:
+        ValueError: If text is not exactly one number
+
+    Examples:
+        >>> words2num("нэг зуун хорин гурав")
+        123
+        >>> words2num("гурав зууны арван дөрөв")
+        Decimal('3.14')
+    """
+    lowered = text.lower()
+    integer = _words2int(lowered)
+    if integer is not None:
+        return integer
+    words = lowered.split()
+    parsed = _parse_number(words, 0)
+    if parsed is None or parsed[1] != len(words):
+        raise ValueError(f"Invalid number words: {text!r}")
+    return parsed[0]
+
+
+def find_number_words(text: str) -> list[tuple[int, int, int | Decimal]]:
+    """Find spans of Mongolian number words inside text.
+
+    Words of one number must be separated by whitespace only, so "тав, зургаа"
+    gives two spans.
+
+    Args:
+        text: Text that may contain number words
+
+    Returns:
+        (start, end, value) for each span, in text order
+
+    Examples:
+        >>> find_number_words("Тэр хорин таван настай")
+        [(4, 15, 25)]
+    """
+    # Match on text itself and lowercase each word: lowercasing the whole text can
+    # change its length ("İ" -> "i̇") and shift the offsets
+    matches = list(_WORD_RE.finditer(text))
+    spans = []
+    i = 0
+    while i < len(matches):
+        # Number words must be joined by whitespace alone, so parse one run at a time
+        run_end = i + 1
+        while (
+            run_end < len(matches)
+            and text[matches[run_end - 1].end() : matches[run_end].start()].isspace()
+        ):
+            run_end += 1
+        words = [m.group().lower() for m in matches[i:run_end]]
+        j = 0
+        while j < len(words):
+            parsed = _parse_number(words, j)
+            if parsed is None:
+                j += 1
+                continue
+            value, end = parsed
+            spans.append((matches[i + j].start(), matches[i + end - 1].end(), value))
+            j = end
+        i = run_end
+    return spans
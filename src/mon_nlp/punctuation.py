@@ -1,11 +1,13 @@
 """Punctuation normalization for Mongolian text."""
 
 import json
-import re
 from pathlib import Path
 
 _DATA_DIR = Path(__file__).parent / "data"
 _PUNCT_DATA: dict | None = None
+_NORMALIZE_PAIRS: tuple[tuple[str, str], ...] | None = None
+_TO_WORDS_PAIRS: tuple[tuple[str, str], ...] | None = None
+_REMOVE_MARKS: tuple[str, ...] | None = None
 
 
 def _load_data() -> dict:
@@ -17,26 +19,52 @@ def _load_data() -> dict:
     return _PUNCT_DATA
 
 
+def _get_normalize_pairs() -> tuple[tuple[str, str], ...]:
+    global _NORMALIZE_PAIRS
+    if _NORMALIZE_PAIRS is None:
+        _NORMALIZE_PAIRS = tuple(_load_data()["normalize"].items())
+    return _NORMALIZE_PAIRS
+
+
 def normalize(text: str) -> str:
     """Replace uncommon punctuation marks with ASCII equivalents."""
-    data = _load_data()
-    for old, new in data["normalize"].items():
+    # Every mark being normalized is non-ASCII, so pure ASCII text is already normal.
+    # str.replace returns the input unchanged when a mark is absent, which beats a
+    # str.translate table on Cyrillic text: translate pays a dict lookup per character.
+    if text.isascii():
+        return text
+    for old, new in _get_normalize_pairs():
         text = text.replace(old, new)
     return text
 
 
+def _get_to_words_pairs() -> tuple[tuple[str, str], ...]:
+    global _TO_WORDS_PAIRS
+    if _TO_WORDS_PAIRS is None:
+        _TO_WORDS_PAIRS = tuple(
+            (punct, f" {word} ") for punct, word in _load_data()["to_words"].items()
+        )
+    return _TO_WORDS_PAIRS
+
+
+def _get_remove_marks() -> tuple[str, ...]:
+    global _REMOVE_MARKS
+    if _REMOVE_MARKS is None:
+        data = _load_data()
+        _REMOVE_MARKS = tuple(dict.fromkeys([*data["normalize"], *data["to_words"]]))
+    return _REMOVE_MARKS
+
+
 def to_words(text: str) -> str:
     """Replace punctuation marks with their Mongolian word equivalents."""
-    data = _load_data()
-    for punct, word in data["to_words"].items():
-        text = text.replace(punct, f" {word} ")
-    return re.sub(r"\s+", " ", text).strip()
+    for punct, word in _get_to_words_pairs():
+        text = text.replace(punct, word)
+    # Same result as re.sub(r"\s+", " ", text).strip(): both split on str.isspace()
+    return " ".join(text.split())
 
 
 def remove(text: str) -> str:
     """Remove all punctuation marks from text."""
-    data = _load_data()
-    all_puncts = set(data["normalize"].keys()) | set(data["to_words"].keys())
-    for punct in all_puncts:
+    for punct in _get_remove_marks():
         text = text.replace(punct, " ")
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
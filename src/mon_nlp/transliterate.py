@@ -1,5 +1,13 @@
 """English to Mongolian Cyrillic transliteration via IPA."""
 
+import os
+import re
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from mon_nlp.ipa_cache import IPACache
+
 IPA_MAP = [
     ("aɪ", "ай"),
     ("b", "б"),
@@ -121,45 +129,236 @@ IPA_MAP = [
 IPA_MAP_SORTED = sorted(IPA_MAP, key=lambda x: len(x[0]), reverse=True)
 
 
+def _trie_pattern(sequences: list[str], prefix: str = "") -> str:
+    """Regex for the sequences below prefix, factored as a trie.
+
+    Each branch tries its longer continuations first and falls back to the
+    shorter sequence, so a match is always the longest one at its position.
+    """
+    branches = []
+    leaves = []
+    for char in sorted({seq[len(prefix)] for seq in sequences if len(seq) > len(prefix)}):
+        below = [seq for seq in sequences if seq.startswith(prefix + char)]
+        rest = _trie_pattern(below, prefix + char)
+        if rest:
+            branches.append(re.escape(char) + rest)
+        else:
+            leaves.append(re.escape(char))
+    if len(leaves) > 1:
+        branches.append(f"[{''.join(leaves)}]")
+    else:
+        branches.extend(leaves)
+    if not branches:
+        return ""
+    body = "|".join(branches)
+    if prefix in sequences:
+        return f"(?:{body})?"
+    return f"(?:{body})"
+
+
+# Cache keys: runs of letters and digits, with inner apostrophes ("don't")
+_WORD_RE = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+
+# Latin-script runs inside other text: Latin words (with inner apostrophes,
+# hyphens and dots, e.g. "don't", "e-mail", "Node.js") joined by spaces or tabs
+_LATIN_WORD = r"[A-Za-zÀ-ÖØ-öø-ɏ]+(?:['’.\-][A-Za-zÀ-ÖØ-öø-ɏ]+)*"
+_LATIN_RUN_RE = re.compile(rf"{_LATIN_WORD}(?:[ \t]+{_LATIN_WORD})*")
+
+# Multi-character sequences are matched longest first in one scan; single
+# characters cannot overlap each other, and no Cyrillic output contains an IPA
+# character, so replacing them afterwards gives the same result as one full scan
+_IPA_MULTI = {seq: cyrillic for seq, cyrillic in IPA_MAP if len(seq) > 1}
+_IPA_SINGLE = [(seq, cyrillic) for seq, cyrillic in IPA_MAP if len(seq) == 1]
+# Captured, so re.split returns unmapped text at even and IPA sequences at odd indices
+_IPA_SPLIT = re.compile(f"({_trie_pattern(list(_IPA_MULTI))})")
+
+
+def _splice_runs(text: str, matches: list[re.Match[str]], cyrillic: dict[str, str]) -> str:
+    """Put each matched run's transliteration in its place, keeping failed runs."""
+    parts = []
+    end = 0
+    for match in matches:
+        run = match.group()
+        parts.append(text[end : match.start()])
+        parts.append(cyrillic[run] or run)
+        end = match.end()
+    parts.append(text[end:])
+    return "".join(parts)
+
+
 class EnglishToCyrillic:
-    """Transliterates English text to Mongolian Cyrillic via IPA."""
+    """Transliterates English text to Mongolian Cyrillic via IPA.
 
-    def __init__(self):
-        self._phonemizer = None
+    Keeps one espeak backend per language for the converter's lifetime, so
+    espeak is set up once instead of on every call. Backend calls are
+    serialized, so one converter can be shared between threads.
 
-    def _get_phonemizer(self):
-        if self._phonemizer is None:
-            try:
-                from phonemizer import phonemize
+    With a cache, texts are phonemized word by word: words are looked up in
+    the cache first and only the missing ones go to espeak, in one batch.
 
-                self._phonemizer = phonemize
+    Args:
+        cache: IPACache (or path to its database file) for word IPA, if any
+    """
+
+    def __init__(self, cache: IPACache | str | os.PathLike[str] | None = None):
+        if cache is not None and not isinstance(cache, IPACache):
+            cache = IPACache(cache)
+        self._cache = cache
+        self._backends: dict[str, Any] = {}
+        self._separator = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> IPACache | None:
+        """Persistent word IPA cache, if any."""
+        return self._cache
+
+    def _get_backend(self, language: str):
+        backend = self._backends.get(language)
+        if backend is None:
+            try:
+                from phonemizer.backend import EspeakBackend
+                from phonemizer.separator import Separator
             except ImportError:
                 raise ImportError(
                     "phonemizer package is required for English transliteration. "
                     "Install with: pip install mon-nlp[transliterate]"
                 )
-        return self._phonemizer
-
-    def get_ipa(self, text: str, language: str = "en-us") -> str:
-        """Get IPA representation of English text."""
-        phonemize = self._get_phonemizer()
-        try:
-            return phonemize(
-                text,
-                language=language,
-                backend="espeak",
-                strip=True,
+            # Same settings (and separator) the phonemize() call used to get
+            backend = EspeakBackend(
+                language,
                 preserve_punctuation=True,
                 with_stress=False,
                 language_switch="remove-flags",
             )
+            self._backends[language] = backend
+            self._separator = Separator(phone="", syllable="", word=" ")
+        return backend
+
+    def _phonemize(self, texts: list[str], language: str, njobs: int) -> list[str]:
+        """Phonemize texts in one backend call, one result per text (internal).
+
+        Like phonemize() on a single string, each text is split into lines,
+        blank lines are dropped and the phonemized lines are joined back.
+        """
+        with self._lock:
+            backend = self._get_backend(language)
+        lines: list[str] = []
+        line_counts = []
+        for text in texts:
+            text_lines = [line for line in text.strip(os.linesep).split(os.linesep) if line.strip()]
+            lines.extend(text_lines)
+            line_counts.append(len(text_lines))
+        if lines:
+            with self._lock:
+                phonemized = backend.phonemize(
+                    lines, separator=self._separator, strip=True, njobs=njobs
+                )
+        else:
+            phonemized = []
+        results = []
+        start = 0
+        for count in line_counts:
+            results.append(os.linesep.join(phonemized[start : start + count]))
+            start += count
+        return results
+
+    def get_ipa(self, text: str, language: str = "en-us") -> str:
+        """Get IPA representation of English text."""
+        return self.get_ipa_many([text], language)[0]
+
+    def get_ipa_many(
+        self, texts: Iterable[str], language: str = "en-us", njobs: int = 1
+    ) -> list[str]:
+        """Get IPA representations of many English texts with one backend call.
+
+        If the batch fails, texts are retried one by one so only the failing
+        ones come back as "". With a cache, only words missing from it are
+        phonemized.
+
+        Args:
+            texts: English texts
+            language: Source language code (default: "en-us")
+            njobs: Number of parallel espeak jobs used by phonemizer
+
+        Returns:
+            IPA for each text, in input order
+        """
+        texts = list(texts)
+        if self._cache is not None:
+            return self._get_ipa_cached(texts, language, njobs)
+        return self._get_ipa_uncached(texts, language, njobs)
+
+    def _get_ipa_uncached(self, texts: list[str], language: str, njobs: int) -> list[str]:
+        try:
+            return self._phonemize(texts, language, njobs)
+        except ImportError:
+            raise
         except Exception:
-            return ""
+            if len(texts) == 1:
+                return [""]
+        results = []
+        for text in texts:
+            try:
+                results.append(self._phonemize([text], language, 1)[0])
+            except Exception:
+                results.append("")
+        return results
+
+    def _get_ipa_cached(self, texts: list[str], language: str, njobs: int) -> list[str]:
+        """Phonemize texts word by word through the cache (internal).
+
+        A text comes back as "" if espeak failed on any of its words.
+        """
+        texts = [text.strip() for text in texts]
+        words = {match.lower() for text in texts for match in _WORD_RE.findall(text)}
+        found = self._cache.get_many(language, words)
+        found.update(self._cache_missing(words - found.keys(), language, njobs))
+        results = []
+        for text in texts:
+            if all(word.lower() in found for word in _WORD_RE.findall(text)):
+                results.append(_WORD_RE.sub(lambda m: found[m.group().lower()], text))
+            else:
+                results.append("")
+        return results
+
+    def _cache_missing(self, words: set[str], language: str, njobs: int) -> dict[str, str]:
+        """Phonemize words in one batch and store the ones espeak handled (internal)."""
+        if not words:
+            return {}
+        batch = sorted(words)
+        ipas = self._get_ipa_uncached(batch, language, njobs)
+        new = {word: ipa for word, ipa in zip(batch, ipas) if ipa}
+        self._cache.put_many(language, new)
+        return new
+
+    def warm_cache(self, words: Iterable[str], language: str = "en-us", njobs: int = 1) -> int:
+        """Phonemize the words not yet in the cache and store them.
+
+        Args:
+            words: Words (or texts) to precompute
+            language: Source language code (default: "en-us")
+            njobs: Number of parallel espeak jobs used by phonemizer
+
+        Returns:
+            Number of words added to the cache
+        """
+        if self._cache is None:
+            raise ValueError("EnglishToCyrillic was created without a cache")
+        words = {match.lower() for text in words for match in _WORD_RE.findall(text)}
+        missing = words - self._cache.get_many(language, words).keys()
+        return len(self._cache_missing(missing, language, njobs))
 
     def ipa_to_cyrillic(self, ipa_text: str) -> str:
-        """Convert IPA text to Cyrillic."""
-        result = ipa_text
-        for ipa_seq, cyrillic in IPA_MAP_SORTED:
+        """Convert IPA text to Cyrillic.
+
+        Scans left to right, replacing the longest IPA_MAP sequence at each
+        position; characters without a mapping are kept as they are.
+        """
+        parts = _IPA_SPLIT.split(ipa_text)
+        parts[1::2] = map(_IPA_MULTI.__getitem__, parts[1::2])
+        result = "".join(parts)
+        for ipa_seq, cyrillic in _IPA_SINGLE:
             result = result.replace(ipa_seq, cyrillic)
         return result
 
@@ -179,6 +378,51 @@ class EnglishToCyrillic:
             return ""
         return ipa if output_ipa else self.ipa_to_cyrillic(ipa)
 
+    def transliterate_many(
+        self,
+        texts: Iterable[str],
+        language: str = "en-us",
+        output_ipa: bool = False,
+        njobs: int = 1,
+    ) -> list[str]:
+        """Transliterate many English texts with one phonemizer call.
+
+        Args:
+            texts: English texts to transliterate
+            language: Source language code (default: "en-us")
+            output_ipa: If True, return IPA instead of Cyrillic
+            njobs: Number of parallel espeak jobs used by phonemizer
+
+        Returns:
+            One transliteration per text, in input order ("" for texts that failed)
+        """
+        ipas = self.get_ipa_many(texts, language, njobs)
+        if output_ipa:
+            return ipas
+        return [self.ipa_to_cyrillic(ipa) if ipa else "" for ipa in ipas]
+
+    def transliterate_embedded(self, text: str, language: str = "en-us", njobs: int = 1) -> str:
+        """Transliterate the Latin-script runs inside (Mongolian Cyrillic) text.
+
+        Runs are found in one scan, deduplicated and phonemized in one batch,
+        then spliced back in place; the rest of the text is left as it is, and
+        runs that fail to transliterate are kept in Latin.
+
+        Args:
+            text: Text with embedded English words
+            language: Source language code of the Latin runs (default: "en-us")
+            njobs: Number of parallel espeak jobs used by phonemizer
+
+        Returns:
+            Text with every Latin run replaced by its Cyrillic transliteration
+        """
+        matches = list(_LATIN_RUN_RE.finditer(text))
+        if not matches:
+            return text
+        runs = list(dict.fromkeys(match.group() for match in matches))
+        cyrillic = dict(zip(runs, self.transliterate_many(runs, language, njobs=njobs)))
+        return _splice_runs(text, matches, cyrillic)
+
 
 _default_converter: EnglishToCyrillic | None = None
 
@@ -204,6 +448,18 @@ def transliterate(text: str, language: str = "en-us", output_ipa: bool = False)
     return _get_converter().transliterate(text, language, output_ipa)
 
 
+def transliterate_many(
+    texts: Iterable[str], language: str = "en-us", output_ipa: bool = False, njobs: int = 1
+) -> list[str]:
+    """Transliterate many English texts to Mongolian Cyrillic, one result per text."""
+    return _get_converter().transliterate_many(texts, language, output_ipa, njobs)
+
+
+def transliterate_embedded(text: str, language: str = "en-us", njobs: int = 1) -> str:
+    """Transliterate the Latin-script runs inside text, leaving the rest as it is."""
+    return _get_converter().transliterate_embedded(text, language, njobs)
+
+
 def get_ipa(text: str, language: str = "en-us") -> str:
     """Get IPA representation of English text."""
     return _get_converter().get_ipa(text, language)
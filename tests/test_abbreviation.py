@@ -34,3 +34,72 @@ def test_get_all():
     abbrevs = expander.get_all()
     assert "МУ" in abbrevs
     assert abbrevs["МУ"] == "Монгол Улс"
+
+
+def test_longest_match_first():
+    assert abbreviation.expand("ХХК") == "хязгаарлагдмал хариуцлагатай компани"
+    assert abbreviation.expand("ХК ба ХХК") == (
+        "хувьцаат компани ба хязгаарлагдмал хариуцлагатай компани"
+    )
+
+
+def test_expansion_not_rescanned():
+    expander = AbbreviationExpander({"АА": "ББ", "ББ": "ВВ"})
+    assert expander.expand("АА ББ") == "ББ ВВ"
+
+
+def test_lazy_rebuild():
+    expander = AbbreviationExpander({})
+    count = len(expander.get_all())
+    expander.expand("МУ")
+    assert expander.pattern_count == count
+    version = expander.version
+
+    expander.update_many({"АА": "а а", "ББ": "б б", "ВВ": "в в"})
+    expander.remove_many(["ББ", "ГГ"])
+    assert expander.version == version + 2
+    assert expander.pattern_count == count
+
+    assert expander.expand("АА ББ ВВ") == "а а ББ в в"
+    assert expander.pattern_count == count + 2
+    assert expander.build_time > 0
+
+    expander.remove("ГГ")
+    assert expander.version == version + 2
+
+
+def test_expand_suffixes():
+    assert abbreviation.expand("МУИС-ийн оюутан", suffixes=True) == (
+        "Монгол Улсын Их Сургуулийн оюутан"
+    )
+    assert abbreviation.expand("УБ-д очсон", suffixes=True) == "Улаанбаатард очсон"
+    assert abbreviation.expand("НҮБ-д", suffixes=True) == "Нэгдсэн Үндэстний Байгууллагад"
+    assert abbreviation.expand("ТВээр", suffixes=True) == "телевизээр"
+    assert abbreviation.expand("МУ нь", suffixes=True) == "Монгол Улс нь"
+    assert abbreviation.expand("ТВээр") == "ТВээр"
+
+
+def test_custom_expander_suffixes():
+    expander = AbbreviationExpander({"ХБХ": "хэл боловсруулах хэрэгсэл"}, suffixes=True)
+    assert expander.expand("ХБХ-д") == "хэл боловсруулах хэрэгсэлд"
+    assert expander.expand("МУ-ын") == "Монгол Улсын"
+
+
+def test_custom_expander_lowercase_suffixes():
+    expander = AbbreviationExpander({"м": "метр", "кг": "килограмм"}, suffixes=True)
+    # Lowercase abbreviations need the hyphen, so ordinary words are left alone
+    assert expander.expand("маш мөнгө кгаас") == "маш мөнгө кгаас"
+    assert expander.expand("5 м-ээс 2 кг") == "5 метрээс 2 килограмм"
+
+    lowercase_only = AbbreviationExpander(suffixes=True)
+    lowercase_only.remove_many(list(lowercase_only.get_all()))
+    lowercase_only.add("км", "километр")
+    assert lowercase_only.expand("км-ийн кмаас") == "километрийн кмаас"
+
+
+def test_custom_expander_one_letter_suffixes():
+    expander = AbbreviationExpander(suffixes=True)
+    expander.add("Д", "Доктор")
+    # A one-letter abbreviation needs the hyphen, even when it is uppercase
+    assert expander.expand("Дорж ирсэн") == "Дорж ирсэн"
+    assert expander.expand("Д-ын ажил") == "Докторын ажил"
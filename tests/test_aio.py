@@ -0,0 +1,128 @@
+"""Tests for aio module."""
+
+import asyncio
+
+import pytest
+
+from mon_nlp import g2p, verbalize_numbers
+from mon_nlp.aio import AsyncConverter
+from mon_nlp.transliterate import EnglishToCyrillic
+
+IPA = {"hello": "həloʊ", "world": "wɜːld", "Google": "ɡuːɡəl"}
+
+
+class RecordingTransliterator(EnglishToCyrillic):
+    """Looks IPA up in a table and records each batch instead of running espeak."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def get_ipa_many(self, texts, language="en-us", njobs=1):
+        texts = list(texts)
+        self.batches.append(texts)
+        return [IPA.get(text, "") for text in texts]
+
+
+def test_transliterate_batches_and_coalesces():
+    transliterator = RecordingTransliterator()
+    converter = AsyncConverter(batch_window=0.05, transliterator=transliterator)
+
+    async def main():
+        return await asyncio.gather(
+            converter.transliterate("hello"),
+            converter.transliterate("world"),
+            converter.transliterate("hello"),
+            converter.transliterate("hello", output_ipa=True),
+            converter.transliterate("unknown"),
+        )
+
+    assert asyncio.run(main()) == ["хэлоүү", "виоурлд", "хэлоүү", "həloʊ", ""]
+    assert transliterator.batches == [["hello", "world", "unknown"]]
+    converter.close()
+
+
+def test_max_batch():
+    transliterator = RecordingTransliterator()
+    converter = AsyncConverter(batch_window=0.05, max_batch=2, transliterator=transliterator)
+
+    async def main():
+        return await converter.transliterate_many(["hello", "world", "hello", "Google"])
+
+    assert asyncio.run(main()) == ["хэлоүү", "виоурлд", "хэлоүү", "гуугэл"]
+    # A full batch goes out at once, the rest when the window ends
+    assert transliterator.batches == [["hello", "world"], ["Google"]]
+    converter.close()
+
+
+def test_transliterate_embedded():
+    transliterator = RecordingTransliterator()
+    converter = AsyncConverter(transliterator=transliterator)
+    text = "Би Google ашигласан, hello гэж Google-ээс"
+
+    async def main():
+        return await asyncio.gather(
+            converter.transliterate_embedded(text),
+            converter.transliterate_embedded("Сайн байна"),
+        )
+
+    assert asyncio.run(main()) == ["Би гуугэл ашигласан, хэлоүү гэж гуугэл-ээс", "Сайн байна"]
+    assert transliterator.batches == [["Google", "hello"]]
+    converter.close()
+
+
+def test_g2p_convert_and_run():
+    converter = AsyncConverter(max_workers=2)
+
+    async def main():
+        return await asyncio.gather(
+            converter.g2p_convert("сайн байна"),
+            converter.g2p_convert("сайн байна"),
+            converter.run(verbalize_numbers, "5 ном"),
+        )
+
+    assert asyncio.run(main()) == [g2p.convert("сайн байна")] * 2 + [verbalize_numbers("5 ном")]
+    converter.close()
+
+
+def test_cancelled_batch_cancels_waiters():
+    converter = AsyncConverter(transliterator=RecordingTransliterator())
+
+    async def main():
+        waiters = [asyncio.ensure_future(converter.get_ipa(text)) for text in ["hello", "world"]]
+        await asyncio.sleep(0)
+        task = asyncio.get_running_loop().create_future()
+        task.cancel()
+        converter._resolve("en-us", converter._batches.pop("en-us"), task)
+        converter._timers.pop("en-us").cancel()
+        results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert not converter._pending
+
+    asyncio.run(main())
+    converter.close()
+
+
+def test_reuse_across_event_loops():
+    transliterator = RecordingTransliterator()
+    converter = AsyncConverter(batch_window=0.05, transliterator=transliterator)
+
+    async def timed_out():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(converter.transliterate("hello"), 0.001)
+
+    async def main():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                converter.transliterate("world"),
+                converter.transliterate("hello"),
+                converter.run(verbalize_numbers, "5 ном"),
+            ),
+            1,
+        )
+
+    # The first loop closes with "hello" still waiting for its batch
+    asyncio.run(timed_out())
+    assert asyncio.run(main()) == ["виоурлд", "хэлоүү", verbalize_numbers("5 ном")]
+    assert transliterator.batches == [["world", "hello"]]
+    converter.close()
@@ -48,3 +48,56 @@ def test_get_mappings():
 
 def test_no_emoji():
     assert emoji.emoji_to_words("Сайн байна") == "Сайн байна"
+
+
+def test_longest_sequence_wins():
+    emoji.add_emoji_mapping("👍🏽", "дунд өнгийн эрхий хуруу")
+    emoji.add_emoji_mapping("👍", "эрхий хуруу")
+    emoji.add_emoji_mapping("👨", "эрэгтэй")
+    emoji.add_emoji_mapping("👨‍💻", "программист")
+    try:
+        assert emoji.emoji_to_words("👍🏽👍") == "дунд өнгийн эрхий хуруу эрхий хуруу"
+        assert emoji.emoji_to_words("👨‍💻 ба 👨") == "программист ба эрэгтэй"
+    finally:
+        for key in ["👍🏽", "👍", "👨", "👨‍💻"]:
+            emoji.remove_emoji_mapping(key)
+
+
+def test_non_emoji_custom_mapping():
+    # Keys without emoji codepoints turn the fast reject off
+    emoji.add_emoji_mapping(":)", "инээмсэглэл")
+    try:
+        assert emoji.emoji_to_words("Сайн :)") == "Сайн инээмсэглэл"
+    finally:
+        emoji.remove_emoji_mapping(":)")
+    assert emoji.emoji_to_words("Сайн :)") == "Сайн :)"
+
+
+def test_no_emoji_collapses_whitespace():
+    assert emoji.emoji_to_words("  Сайн   байна ") == "Сайн байна"
+
+
+def test_batch_mappings():
+    generation = emoji.get_emoji_generation()
+    emoji.add_emoji_mappings({"🎂": "бялуу", "🎁": "бэлэг"})
+    assert emoji.get_emoji_generation() == generation + 1
+    assert emoji.emoji_to_words("🎂🎁") == "бялуу бэлэг"
+
+    emoji.remove_emoji_mappings(["🎂", "🎁", "🆖"])
+    assert emoji.get_emoji_generation() == generation + 2
+    assert emoji.emoji_to_words("🎂") == "🎂"
+
+    emoji.remove_emoji_mappings(["🎂"])
+    assert emoji.get_emoji_generation() == generation + 2
+
+
+def test_remove_emoji_sequences():
+    assert emoji.remove_emoji("👨‍👩‍👧 гэр бүл") == " гэр бүл"
+    assert emoji.remove_emoji("👍🏽 ❤️ 🇲🇳 ☺︎") == "   "
+    assert emoji.remove_emoji("1️⃣ #⃣ 2024 онд") == "  2024 онд"
+
+
+def test_remove_emoji_fast_reject():
+    text = "Сайн байна уу, “найз” минь — 5%!"
+    assert emoji.remove_emoji(text) == text
+    assert emoji.remove_emoji(text + " 😀", fast_reject=False) == text + " "
@@ -1,5 +1,7 @@
 """Tests for g2p module."""
 
+import pytest
+
 from mon_nlp import g2p
 from mon_nlp.g2p import G2P
 
@@ -21,15 +23,108 @@ def test_convert():
     )
 
 
+def test_cleaning():
+    assert g2p.syllabify("МОНГОЛ Байна") == ["мон", "гол", "бай", "на"]
+    assert g2p.convert("Сайн, байна! hello 123 (ТВ)") == "s-ay1-ng|*b-ay1|n-a0|*t-v|"
+
+
 def test_convert_multiple_words():
     assert g2p.convert("сайн байна уу") == "s-ay1-ng|*b-ay1|n-a0|*u:1|"
 
 
+def test_syllable_rule_order():
+    converter = G2P()
+    assert converter._syllable_to_phoneme("аай", True, True) == "a1-ay1"
+    assert converter._syllable_to_phoneme("яай", True, False) == "j-a0-ay0"
+    assert converter._syllable_to_phoneme("тее", False, True) == "t-e1-j-e1"
+    assert converter._syllable_to_phoneme("нсн", False, False) == "ng-s-n"
+    assert converter._syllable_to_phoneme("биа", True, True) == "B-A:1"
+    assert converter._syllable_to_phoneme("биа", False, True) == "b-A:1"
+
+
 def test_g2p_class():
     converter = G2P()
     assert converter.convert("монгол") == "m-o1-ng|G-o0-l|"
 
 
+def test_word_cache():
+    converter = G2P(cache_size=2)
+    assert converter.convert("сайн байна сайн") == "s-ay1-ng|*b-ay1|n-a0|*s-ay1-ng|"
+    assert (converter.cache_hits, converter.cache_misses, converter.cache_evictions) == (1, 2, 0)
+    assert converter.convert("монгол Сайн") == "m-o1-ng|G-o0-l|*s-ay1-ng|"
+    assert (converter.cache_hits, converter.cache_misses, converter.cache_evictions) == (2, 3, 1)
+    converter.clear_cache()
+    assert (converter.cache_hits, converter.cache_misses, converter.cache_evictions) == (0, 0, 0)
+    assert G2P().convert("сайн сайн") == "s-ay1-ng|*s-ay1-ng|"
+
+    g2p.clear_cache()
+    g2p.convert("сайн сайн")
+    assert g2p.cache_info()["hits"] == 1
+
+
+def test_set_cache_size():
+    converter = G2P(cache_size=3)
+    converter.convert("сайн байна монгол")
+    converter.set_cache_size(1)
+    assert (converter.cache_size, converter.cache_evictions) == (1, 2)
+    converter.convert("монгол")
+    assert converter.cache_hits == 1
+    with pytest.raises(ValueError):
+        converter.set_cache_size(-1)
+
+    try:
+        g2p.set_cache_size(0)
+        g2p.clear_cache()
+        assert g2p.convert("сайн сайн") == "s-ay1-ng|*s-ay1-ng|"
+        assert g2p.cache_info() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+    finally:
+        g2p.set_cache_size(g2p.DEFAULT_CACHE_SIZE)
+    g2p.convert("сайн сайн")
+    assert g2p.cache_info()["hits"] == 1
+
+
+def test_convert_many():
+    texts = ["сайн байна уу", "", "монгол сайн", "сайн"] * 3
+    expected = [g2p.convert(text) for text in texts]
+    converter = G2P()
+    assert list(converter.convert_many(texts, chunksize=5)) == expected
+    assert list(converter.convert_many(iter(texts), workers=2, chunksize=2)) == expected
+    assert list(g2p.convert_many(texts)) == expected
+    with pytest.raises(ValueError):
+        list(converter.convert_many(texts, workers=0))
+
+
+def _ids_to_string(result: g2p.PhonemeIds) -> str:
+    text = ""
+    for phoneme_id, stress, syllable_end, word_end in zip(*result, strict=True):
+        text += g2p.PHONEME_INVENTORY[phoneme_id]
+        if g2p.PHONEME_INVENTORY[phoneme_id][0] in g2p.PO_VOWELS + "AOU":
+            text += str(stress)
+        text += "|" if syllable_end else "-"
+        if word_end:
+            text += "*"
+    return text.rstrip("*")
+
+
+def test_convert_ids():
+    text = "магадгүй тэртээ олон зуун жилийн өмнө, биологи сайн байна уу"
+    result = g2p.convert_ids(text)
+    assert result.ids.typecode == "H"
+    assert _ids_to_string(result) == g2p.convert(text)
+    assert [g2p.PHONEME_INVENTORY[i] for i in g2p.convert_ids("сайн").ids] == ["s", "ay", "ng"]
+    assert list(g2p.convert_ids("сайн").stress) == [0, 1, 0]
+    assert len(g2p.convert_ids("").ids) == 0
+
+
+def test_pad_phoneme_ids():
+    np = pytest.importorskip("numpy")
+    batch = [g2p.convert_ids("сайн"), g2p.convert_ids("сайн байна")]
+    padded = g2p.pad_phoneme_ids(batch)
+    assert padded.dtype == np.uint16
+    assert padded.shape == (2, 7)
+    assert padded[0].tolist() == list(batch[0].ids) + [0, 0, 0, 0]
+
+
 def test_empty():
     assert g2p.convert("") == ""
     assert g2p.syllabify("") == [""]
@@ -0,0 +1,55 @@
+"""Tests for ipa_cache module."""
+
+import pytest
+
+from mon_nlp.ipa_cache import IPACache
+from mon_nlp.transliterate import EnglishToCyrillic
+
+
+def test_get_and_put(tmp_path):
+    with IPACache(tmp_path / "ipa.db") as cache:
+        cache.put_many("en-us", {"hello": "həloʊ", "world": "wɜːld"})
+        cache.put_many("en-gb", {"hello": "hələʊ"})
+        assert len(cache) == 3
+        assert cache.get_many("en-us", ["hello", "world", "foo", "hello"]) == {
+            "hello": "həloʊ",
+            "world": "wɜːld",
+        }
+        assert cache.get_many("en-gb", ["hello"]) == {"hello": "hələʊ"}
+        assert (cache.hits, cache.misses) == (3, 1)
+        assert cache.hit_rate == 0.75
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses, cache.hit_rate) == (0, 0, 0.0)
+
+
+def test_persistent(tmp_path):
+    path = tmp_path / "ipa.db"
+    with IPACache(path) as cache:
+        cache.put_many("en-us", {"hello": "həloʊ"})
+    with IPACache(path) as cache:
+        assert cache.get_many("en-us", ["hello"]) == {"hello": "həloʊ"}
+
+
+def test_max_entries(tmp_path):
+    with IPACache(tmp_path / "ipa.db", max_entries=2) as cache:
+        cache.put_many("en-us", {"a": "eɪ"})
+        cache.put_many("en-us", {"b": "biː"})
+        cache.get_many("en-us", ["a"])
+        cache.put_many("en-us", {"c": "siː"})
+        assert len(cache) == 2
+        assert cache.get_many("en-us", ["a", "b", "c"]) == {"a": "eɪ", "c": "siː"}
+    with pytest.raises(ValueError):
+        IPACache(tmp_path / "other.db", max_entries=0)
+
+
+def test_transliterate_from_cache(tmp_path):
+    # Every word is cached, so espeak is never needed
+    cache = IPACache(tmp_path / "ipa.db")
+    cache.put_many("en-us", {"hello": "həloʊ", "world": "wɜːld", "don't": "doʊnt"})
+    converter = EnglishToCyrillic(cache=cache)
+    assert converter.transliterate("Hello, world!") == "хэлоүү, виоурлд!"
+    assert converter.transliterate("Hello, world!", output_ipa=True) == "həloʊ, wɜːld!"
+    assert converter.transliterate_many(["hello", "Don't", ""]) == ["хэлоүү", "доүүнт", ""]
+    assert cache.hits == 6
+    assert converter.warm_cache(["hello world"]) == 0
@@ -0,0 +1,85 @@
+"""Tests for lexicon module."""
+
+import pytest
+
+from mon_nlp import g2p
+from mon_nlp import lexicon as lexicon_module
+from mon_nlp.g2p import G2P
+from mon_nlp.lexicon import Lexicon, build_lexicon
+
+
+def test_build_and_lookup(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    words = ["Монгол", "сайн", "байна", "сайн", "hello", "уу"]
+    count = build_lexicon(words, path)
+    assert count == 4
+    with Lexicon(path) as lexicon:
+        assert len(lexicon) == 4
+        assert lexicon.get("монгол") == g2p.convert("монгол")
+        assert lexicon.get("сайн") == "s-ay1-ng|"
+        assert lexicon.get("байна") == "b-ay1|n-a0|"
+        assert lexicon.get("хэл") is None
+        assert "уу" in lexicon
+        assert "аа" not in lexicon
+
+
+def test_overrides(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    build_lexicon(["сайн"], path, overrides={"Сайн": "s-a:1-ng|", "ок": "o1|k-ey0|"})
+    converter = G2P(lexicon=path)
+    assert converter.convert("сайн ок байна") == "s-a:1-ng|*o1|k-ey0|*b-ay1|n-a0|"
+    cached = G2P(cache_size=10, lexicon=converter.lexicon)
+    assert list(cached.convert_many(["ок", "ок"], workers=2, chunksize=1)) == ["o1|k-ey0|"] * 2
+
+
+def test_convert_ids_uses_lexicon(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    build_lexicon(["сайн"], path, overrides={"ок": "o1|k-ey0|"})
+    converter = G2P(lexicon=path)
+    result = converter.convert_ids("ок сайн")
+    names = ["o", "k", "ey", "s", "ay", "ng"]
+    assert list(result.ids) == [g2p.PHONEME_IDS[name] for name in names]
+    assert list(result.stress) == [1, 0, 0, 0, 1, 0]
+    assert list(result.syllable_ends) == [1, 0, 1, 0, 0, 1]
+    assert list(result.word_ends) == [0, 0, 1, 0, 0, 1]
+    assert converter.convert_ids("байна") == G2P().convert_ids("байна")
+
+
+def test_unusable_overrides(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    # Latin and multi-word keys could never be looked up
+    for word in ["Google", "Нью Йорк", "", "!"]:
+        with pytest.raises(ValueError):
+            build_lexicon([], path, overrides={word: "s-ay1-ng|"})
+    with pytest.raises(ValueError):
+        build_lexicon([], path, overrides={"ок": "o1|q-e0|"})
+
+
+def test_empty_lexicon(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    assert build_lexicon([], path) == 0
+    with Lexicon(path) as lexicon:
+        assert lexicon.get("сайн") is None
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    path.write_bytes(b"not a lexicon")
+    with pytest.raises(ValueError):
+        Lexicon(path)
+    # Shorter than the header, empty, or with the tables cut off
+    build_lexicon(["сайн", "байна"], path)
+    data = path.read_bytes()
+    for truncated in [data[:8], b"", data[:20], data[:-1]]:
+        path.write_bytes(truncated)
+        with pytest.raises(ValueError):
+            Lexicon(path)
+
+
+def test_offsets_without_native_byte_order(tmp_path, monkeypatch):
+    path = tmp_path / "lexicon.bin"
+    build_lexicon(["сайн", "байна"], path)
+    monkeypatch.setattr(lexicon_module, "_NATIVE_U32", False)
+    with Lexicon(path) as lexicon:
+        assert lexicon.get("сайн") == g2p.convert("сайн")
+        assert lexicon.get("монгол") is None
@@ -1,5 +1,10 @@
 """Tests for number module."""
 
+import random
+from decimal import Decimal
+
+import pytest
+
 from mon_nlp import number
 
 
@@ -31,6 +36,12 @@ def test_thousands():
 
 def test_millions():
     assert number.num2words(1_000_000) == "нэг сая"
+    assert number.num2words(2_500_000) == "хоёр сая таван зуун мянга"
+
+
+def test_chunk_forms():
+    assert number.num2words(101_101) == "нэг зуун нэгэн мянга нэг зуун нэг"
+    assert number.num2words(999_999) == "есөн зуун ерэн есөн мянга есөн зуун ерэн ес"
 
 
 def test_negative():
@@ -107,3 +118,188 @@ def test_extra_large_number():
     ]
     for number_input, expected_output in test_cases:
         assert number.num2words(number_input) == expected_output
+
+
+def test_string_input():
+    assert number.num2words("123") == "нэг зуун хорин гурав"
+    assert number.num2words("-42") == "хасах дөчин хоёр"
+    assert number.num2words("007") == "долоо"
+    assert number.num2words("0099", by_n_digits=2) == "тэг, тэг, ерэн ес"
+    assert number.num2words("1000000000000000") == number.num2words(1_000_000_000_000_000)
+
+
+def test_long_digit_string():
+    digits = "1234567890" * 1000
+    result = number.num2words(digits, by_n_digits=2)
+    assert result.count(", ") == len(digits) // 2 - 1
+    assert result.startswith("арван хоёр, гучин дөрөв")
+
+
+def test_huge_int():
+    # Past CPython's 4300-digit limit on int to str conversion
+    digits = "1234567890" * 500
+    value = 0
+    for _ in range(500):
+        value = value * 10**10 + 1234567890
+    assert number.num2words(value) == number.num2words(digits)
+    assert number.num2words(10**5000, by_n_digits=2) == number.num2words(
+        "1" + "0" * 5000, by_n_digits=2
+    )
+
+
+def test_float_digits():
+    assert (
+        number.num2words(959906.69) == "есөн зуун тавин есөн мянга есөн зуун зургаа зууны жаран ес"
+    )
+    assert number.num2words(1e-06) == "тэг саяны нэг"
+
+
+def test_decimal_and_string_fractions():
+    assert number.num2words(Decimal("3.14")) == "гурав зууны арван дөрөв"
+    assert number.num2words(Decimal("-0.001")) == "хасах тэг мянганы нэг"
+    assert number.num2words(Decimal("1.50")) == "нэг аравны тав"
+    assert number.num2words(Decimal("2E+3")) == "хоёр мянга"
+    assert number.num2words("3,05") == "гурав зууны тав"
+    assert number.num2words("3.14", use_dot=True) == "гурав цэг арван дөрөв"
+    assert number.num2words("-0.0") == "тэг"
+
+
+def test_numpy_scalars():
+    np = pytest.importorskip("numpy")
+    assert number.num2words(np.int64(5)) == "тав"
+    assert number.num2words(np.uint8(200)) == "хоёр зуу"
+    assert number.num2words(np.float64(1.5)) == "нэг аравны тав"
+    assert number.num2words(np.float32(2.5)) == "хоёр аравны тав"
+    assert number.num2words(np.float32(0.1)) == "тэг аравны нэг"
+
+
+def test_invalid_input():
+    for value in ["", "abc", "1.2.3", "--1", Decimal("NaN"), float("inf"), None, 1j, [1]]:
+        with pytest.raises(ValueError):
+            number.num2words(value)
+
+
+def test_num2words_batch():
+    values = [0, 1, 1, 25, -42, 1000, 3.14, "0099", 2_345_678_901_234, 10**15]
+    expected = [number.num2words(v) for v in values]
+    assert number.num2words_batch(values) == expected
+    assert number.num2words_batch(iter(values)) == expected
+    assert number.num2words_batch([1000, 1], include_leading_one=False) == ["мянга", ""]
+    assert number.num2words_batch([1234], by_n_digits=2) == ["арван хоёр, гучин дөрөв"]
+
+
+def test_num2words_batch_numpy():
+    np = pytest.importorskip("numpy")
+    values = [0, 5, 5, -42, 1_000_001, 999 * 10**12, -(10**18), 2_345_678_901_234]
+    expected = [number.num2words(v) for v in values]
+    assert number.num2words_batch(np.array(values, dtype=np.int64)) == expected
+    assert number.num2words_batch(np.array([[1, 2], [3, 4]], dtype=np.uint16)) == [
+        "нэг",
+        "хоёр",
+        "гурав",
+        "дөрөв",
+    ]
+
+
+def test_num2words_batch_numpy_fallback():
+    np = pytest.importorskip("numpy")
+    assert number.num2words_batch(np.array([1, 1234]), by_n_digits=2) == [
+        "нэг",
+        "арван хоёр, гучин дөрөв",
+    ]
+    assert number.num2words_batch(np.array([1.5, 2.25, 1.5])) == [
+        "нэг аравны тав",
+        "хоёр зууны хорин тав",
+        "нэг аравны тав",
+    ]
+    assert number.num2words_batch(np.array([0.1], dtype=np.float32)) == ["тэг аравны нэг"]
+    assert number.num2words_batch([np.int64(5), np.float64(1.5), 5]) == [
+        "тав",
+        "нэг аравны тав",
+        "тав",
+    ]
+    assert number.num2words_batch(np.array([1000, 1]), include_leading_one=False) == [
+        "мянга",
+        "",
+    ]
+
+
+def test_verbalize_text():
+    assert number.verbalize_text("Сайн байна уу") == "Сайн байна уу"
+    assert number.verbalize_text("2024 онд 3,5 сая") == (
+        "хоёр мянга хорин дөрөв онд гурав аравны тав сая"
+    )
+    assert number.verbalize_text("-5 хэм, 1.25") == "хасах тав хэм, нэг зууны хорин тав"
+    assert number.verbalize_text("25% ба 10–20%") == "хорин таван хувь ба арав–хорин хувь"
+    assert number.verbalize_text("5-10 хүн") == "тав-арав хүн"
+    assert number.verbalize_text("COVID-19") == "COVID-арван ес"
+    assert number.verbalize_text("XXI зуун", roman=True) == "хорин нэг зуун"
+    assert number.verbalize_text("XXI зуун") == "XXI зуун"
+    assert number.verbalize_text("IIII VX", roman=True) == "IIII VX"
+    assert number.verbalize_text("V зуунд", roman=True) == "тав зуунд"
+    # One-letter numerals need a context word; Latin text is left alone
+    for text in ["Vitamin C", "I love it", "C++ хэл"]:
+        assert number.verbalize_text(text, roman=True) == text
+    assert number.verbalize_text("XL хэмжээ") == "XL хэмжээ"
+    # 3-digit comma groups are thousands, other commas are decimal points
+    assert number.verbalize_text("10,000 төгрөг") == "арван мянга төгрөг"
+    assert number.verbalize_text("1,234,567.5") == number.num2words("1234567.5")
+    assert number.verbalize_text("1,5 кг") == "нэг аравны тав кг"
+    assert number.verbalize_text("1.000.000 төгрөг") == "нэг сая төгрөг"
+    assert number.verbalize_text("1.000.000,5") == number.num2words("1000000.5")
+    assert number.verbalize_text("3.5.2024") == "гурав.тав.хоёр мянга хорин дөрөв"
+    assert number.verbalize_text("v1.2.3") == "vнэг.хоёр.гурав"
+    # A spaced hyphen is not a range; spaced en dashes are
+    assert number.verbalize_text("5 - 3 = 2") == "тав - гурав = хоёр"
+    assert number.verbalize_text("10 – 20 хүн") == "арав–хорь хүн"
+    assert number.verbalize_text("3,5", use_dot=True) == "гурав цэг тав"
+
+
+def test_words2num():
+    assert number.words2num("тэг") == 0
+    assert number.words2num("нэг зуун хорин гурав") == 123
+    assert number.words2num("Хорин таван") == 25
+    assert number.words2num("мянга") == 1000
+    assert number.words2num("хоёр их наяд") == 2 * 10**12
+    assert number.words2num("гурав зууны арван дөрөв") == Decimal("3.14")
+    assert number.words2num("гурав арван мянганы тав") == Decimal("3.0005")
+    assert number.words2num("хасах тэг мянганы нэг") == Decimal("-0.001")
+    assert number.words2num("гурав цэг арван дөрөв") == Decimal("3.14")
+    assert number.words2num("нэг сая мянга") == 1_001_000
+    assert number.words2num("тав  мянга\tнэг") == 5001
+    assert number.words2num("хоёр мянганы тав") == Decimal("2.005")
+    for value in [
+        "",
+        "хасах",
+        "тав тав",
+        "хорин зуу",
+        "гурав цэг",
+        "нэг мянга сая",
+        "хоёр мянга гурван мянга",
+        "тэг мянга",
+    ]:
+        with pytest.raises(ValueError):
+            number.words2num(value)
+
+
+def test_words2num_round_trip():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        value = rng.randint(-999 * 10**12, 999 * 10**12)
+        assert number.words2num(number.num2words(value)) == value
+        value = Decimal(rng.randint(-(10**9), 10**9)).scaleb(-rng.randint(1, 12))
+        assert number.words2num(number.num2words(value)) == value
+
+
+def test_find_number_words():
+    text = "Тэр хорин таван настай, тав зургаа биш"
+    assert number.find_number_words(text) == [(4, 15, 25), (24, 27, 5), (28, 34, 6)]
+    assert number.find_number_words("гурав цэг. Тав, зургаа") == [
+        (0, 5, 3),
+        (11, 14, 5),
+        (16, 22, 6),
+    ]
+    assert number.find_number_words("Сайн байна уу") == []
+    # Offsets stay on the original text when lowercasing changes its length
+    assert number.find_number_words("İ тав") == [(2, 5, 5)]
+    assert number.find_number_words("İİ Хорин") == [(3, 8, 20)]
@@ -8,6 +8,8 @@ def test_normalize():
     assert punctuation.normalize("\u2018тест\u2019") == "'тест'"
     assert punctuation.normalize("текст\u2026") == "текст..."
     assert punctuation.normalize("а\u2013б\u2014в") == "а-б-в"
+    assert punctuation.normalize("\u00abа\u00bb \u2039б\u203a") == "\"а\" 'б'"
+    assert punctuation.normalize('"ascii" - text...') == '"ascii" - text...'
 
 
 def test_to_words():
@@ -26,3 +28,9 @@ def test_empty_string():
     assert punctuation.normalize("") == ""
     assert punctuation.to_words("") == ""
     assert punctuation.remove("") == ""
+
+
+def test_whitespace_collapse():
+    assert punctuation.to_words(" Сайн\t .\n\nбайна ") == "Сайн цэг байна"
+    assert punctuation.to_words("Тийм...") == "Тийм цэг цэг цэг"
+    assert punctuation.remove("“Сайн” — байна…") == "Сайн байна"
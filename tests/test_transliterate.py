@@ -14,6 +14,42 @@ def test_ipa_to_cyrillic():
     assert ipa_to_cyrillic("həloʊ wɜːld") == "хэлоүү виоурлд"
 
 
+@pytest.mark.parametrize(
+    ("ipa", "expected"),
+    [
+        # The longest sequence at each position wins, so glides are kept
+        ("jaɪ", "яи"),
+        ("jeɪə", "ейэ"),
+        ("jeə", "еэ"),
+        ("oiː", "ой"),
+        ("uiː", "үй"),
+        ("ðə beɪʒ hjuː", "дэ бэйж хюу"),
+        ("ˈtʃiːz", "чийс"),
+        # Unmapped characters pass through
+        ("kwiːn, 42!", "квийн, 42!"),
+        ("", ""),
+    ],
+)
+def test_ipa_to_cyrillic_longest_match(ipa, expected):
+    from mon_nlp.transliterate import ipa_to_cyrillic
+
+    assert ipa_to_cyrillic(ipa) == expected
+
+
+def test_ipa_to_cyrillic_matches_longest_first_alternation():
+    import itertools
+    import re
+
+    from mon_nlp.transliterate import IPA_MAP, IPA_MAP_SORTED, ipa_to_cyrillic
+
+    table = dict(IPA_MAP)
+    pattern = re.compile("|".join(re.escape(seq) for seq, _ in IPA_MAP_SORTED))
+    sequences = [*table, " ", ","]
+    for first, second in itertools.product(sequences, repeat=2):
+        text = first + second
+        assert ipa_to_cyrillic(text) == pattern.sub(lambda m: table[m.group()], text), text
+
+
 @pytest.mark.skipif(not HAS_PHONEMIZER, reason="Requires phonemizer with espeak backend")
 def test_transliterate():
     from mon_nlp.transliterate import transliterate
@@ -42,3 +78,50 @@ def test_transliterate_output_ipa():
     assert transliterate("hello", output_ipa=False) == "хэлоүү"
     assert transliterate("on the", output_ipa=True) == "ɔnðə"
     assert transliterate("I am John", output_ipa=True) == "aɪɐm dʒɑːn"
+
+
+@pytest.mark.skipif(not HAS_PHONEMIZER, reason="Requires phonemizer with espeak backend")
+def test_transliterate_many():
+    from mon_nlp.transliterate import EnglishToCyrillic, transliterate
+
+    texts = ["hello", "", "on the", "I am John"]
+    converter = EnglishToCyrillic()
+    assert converter.transliterate_many(texts) == [transliterate(text) for text in texts]
+    assert converter.transliterate_many(texts, output_ipa=True) == [
+        "həloʊ",
+        "",
+        "ɔnðə",
+        "aɪɐm dʒɑːn",
+    ]
+    assert converter.transliterate_many(["hello", "on the"], njobs=2) == ["хэлоүү", "ондэ"]
+
+
+def test_transliterate_embedded_without_latin():
+    from mon_nlp.transliterate import EnglishToCyrillic
+
+    # No Latin runs, so espeak is never needed
+    converter = EnglishToCyrillic()
+    assert converter.transliterate_embedded("Сайн байна уу? 123") == "Сайн байна уу? 123"
+    assert converter.transliterate_embedded("") == ""
+
+
+def test_transliterate_embedded_from_cache(tmp_path):
+    from mon_nlp.ipa_cache import IPACache
+    from mon_nlp.transliterate import EnglishToCyrillic
+
+    cache = IPACache(tmp_path / "ipa.db")
+    cache.put_many("en-us", {"google": "ɡuːɡəl", "maps": "mæps", "hello": "həloʊ"})
+    converter = EnglishToCyrillic(cache=cache)
+    text = "Би Google Maps ашигласан, hello гэж бичээд Google-ээс хайсан"
+    assert converter.transliterate_embedded(text) == (
+        "Би гуугэл мэайпс ашигласан, хэлоүү гэж бичээд гуугэл-ээс хайсан"
+    )
+    # "Google" is looked up once for both of its runs
+    assert (cache.hits, cache.misses) == (3, 0)
+
+
+@pytest.mark.skipif(not HAS_PHONEMIZER, reason="Requires phonemizer with espeak backend")
+def test_transliterate_embedded():
+    from mon_nlp.transliterate import transliterate_embedded
+
+    assert transliterate_embedded("Би hello гэж хэлсэн") == "Би хэлоүү гэж хэлсэн"